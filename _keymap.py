@@ -0,0 +1,134 @@
+"""Generated by tools/gen_keymap.py - do not edit"""
+
+COMMAND_NAME_TO_KEYCODE = {
+    'play/pause': ('Play/Pause', 205, True),
+    'stop': ('Stop', 183, True),
+    'next': ('Next', 181, True),
+    'prev': ('Prev', 182, True),
+    'vol+': ('Vol+', 233, True),
+    'vol-': ('Vol-', 234, True),
+    'mute': ('Mute', 226, True),
+    'record': ('Record', 178, True),
+    'ffwd': ('FFwd', 179, True),
+    'rewind': ('Rewind', 180, True),
+    'eject': ('Eject', 184, True),
+    'bright+': ('Bright+', 111, True),
+    'bright-': ('Bright-', 112, True),
+    'a': 4,
+    'b': 5,
+    'c': 6,
+    'd': 7,
+    'e': 8,
+    'f': 9,
+    'g': 10,
+    'h': 11,
+    'i': 12,
+    'j': 13,
+    'k': 14,
+    'l': 15,
+    'm': 16,
+    'n': 17,
+    'o': 18,
+    'p': 19,
+    'q': 20,
+    'r': 21,
+    's': 22,
+    't': 23,
+    'u': 24,
+    'v': 25,
+    'w': 26,
+    'x': 27,
+    'y': 28,
+    'z': 29,
+    '0': 39,
+    '1': 30,
+    '2': 31,
+    '3': 32,
+    '4': 33,
+    '5': 34,
+    '6': 35,
+    '7': 36,
+    '8': 37,
+    '9': 38,
+    ' ': 44,
+    '-': 45,
+    '=': 46,
+    '[': 47,
+    ']': 48,
+    '\\': 49,
+    ';': 51,
+    "'": 52,
+    ',': 54,
+    '.': 55,
+    '/': 56,
+    '`': 53,
+    '~': (225, 53),
+    '!': (225, 30),
+    '@': (225, 31),
+    '#': (225, 32),
+    '$': (225, 33),
+    '%': (225, 34),
+    '^': (225, 35),
+    '&': (225, 36),
+    '*': (225, 37),
+    '(': (225, 38),
+    ')': (225, 39),
+    '_': (225, 45),
+    '+': (225, 46),
+    '{': (225, 47),
+    '}': (225, 48),
+    '|': (225, 49),
+    ':': (225, 51),
+    '"': (225, 52),
+    '<': (225, 54),
+    '>': (225, 55),
+    '?': (225, 56),
+    'enter': 40,
+    'esc': 41,
+    'bksp': 42,
+    'tab': 43,
+    'capslk': 57,
+    'ctrl': 224,
+    'shift': 225,
+    'alt': 226,
+    'gui': 227,
+    'f1': 58,
+    'f2': 59,
+    'f3': 60,
+    'f4': 61,
+    'f5': 62,
+    'f6': 63,
+    'f7': 64,
+    'f8': 65,
+    'f9': 66,
+    'f10': 67,
+    'f11': 68,
+    'f12': 69,
+    'ins': 73,
+    'del': 76,
+    'home': 74,
+    'end': 77,
+    'pgup': 75,
+    'pgdn': 78,
+    'up': 82,
+    'down': 81,
+    'left': 80,
+    'right': 79,
+    'numlk': 83,
+    'kp /': 84,
+    'kp *': 85,
+    'kp -': 86,
+    'kp +': 87,
+    'kp ent': 88,
+    'kp 1': 89,
+    'kp 2': 90,
+    'kp 3': 91,
+    'kp 4': 92,
+    'kp 5': 93,
+    'kp 6': 94,
+    'kp 7': 95,
+    'kp 8': 96,
+    'kp 9': 97,
+    'kp 0': 98,
+    'kp .': 99,
+}
@@ -1,57 +1,77 @@
-"""Main execution file for Picomote IR
-
-Entry point for the application that:
-1. Initializes the HIDMapperDevice instance
-2. Runs the main event loop
-3. Handles errors and provides visual feedback
-4. Performs automatic recovery via reboot when needed
-"""
-
-import time
-import supervisor
-import traceback
-
-from config import logger, settings, HAS_KEYCODE, HAS_CONSUMER, HAS_IRREMOTE, __version__
-from device import HIDMapperDevice
-
-def main():
-    logger.info("Main", f"--- Starting Picomote IR v{__version__} ---")
-    device = None
-    try:
-        device = HIDMapperDevice()
-
-        while True:
-            device.update()
-            time.sleep(0.01)
-
-    except KeyboardInterrupt:
-        if device and device.display:
-            try:
-                device.display.root_group = None
-            except:
-                pass
-
-    except Exception as e:
-        logger.error("Main", "!!! FATAL ERROR in main loop !!!")
-        logger.error("Main", f"Error Type: {type(e).__name__}")
-        logger.error("Main", f"Error Args: {e.args}")
-
-        print("--- TRACEBACK ---")
-        traceback.print_exception(e, e, e.__traceback__)
-        print("-----------------")
-
-        reboot_delay = settings.get_value("hid_mapper", "timing", {}).get("reboot_delay", 10)
-
-        if device and device.led:
-            try:
-                for _ in range(reboot_delay * 4):
-                    device.led.value = not device.led.value
-                    time.sleep(0.125)
-            except:
-                pass
-
-        time.sleep(reboot_delay)
-        supervisor.reload()
-
-if __name__ == "__main__":
+"""Main execution file for Picomote IR
+
+Entry point for the application that:
+1. Initializes the HIDMapperDevice instance
+2. Runs the main event loop
+3. Handles errors and provides visual feedback
+4. Performs automatic recovery via reboot when needed
+"""
+
+import time
+import gc
+import supervisor
+
+from config import logger, settings, HAS_KEYCODE, HAS_CONSUMER, HAS_IRREMOTE, __version__
+from device import HIDMapperDevice
+
+_TICK_MS = 10
+_TICKS_MASK = 0x1FFFFFFF  # supervisor.ticks_ms() wraps every 2**29 ms
+
+REBOOT_DELAY = settings.get_value("hid_mapper", "timing", {}).get("reboot_delay", 10)
+
+def main():
+    logger.info("Main", "--- Starting Picomote IR v%s ---", __version__)
+    device = None
+    try:
+        device = HIDMapperDevice()
+        gc.collect()
+
+        update = device.update
+        ticks_ms = supervisor.ticks_ms
+        sleep = time.sleep
+        next_tick = ticks_ms()
+        while True:
+            update()
+            next_tick = (next_tick + _TICK_MS) & _TICKS_MASK
+            now = ticks_ms()
+            remaining = (next_tick - now) & _TICKS_MASK
+            if remaining <= _TICK_MS:
+                sleep(remaining / 1000)
+            else:
+                next_tick = now
+
+    except KeyboardInterrupt:
+        if device and device.display:
+            try:
+                device.display.root_group = None
+            except:
+                pass
+
+    except Exception as e:
+        logger.error("Main", "!!! FATAL ERROR in main loop !!!")
+        logger.error("Main", "Error Type: %s", type(e).__name__)
+        logger.error("Main", "Error Args: %s", e.args)
+
+        import io
+        import sys
+        import traceback
+        buf = io.StringIO()
+        buf.write("--- TRACEBACK ---\n")
+        traceback.print_exception(e, e, e.__traceback__, file=buf)
+        buf.write("-----------------\n")
+        sys.stdout.write(buf.getvalue())
+
+        if device and device.led:
+            try:
+                led = device.led
+                for state in (True, False) * (REBOOT_DELAY * 2):
+                    led.value = state
+                    time.sleep(0.125)
+            except:
+                pass
+
+        time.sleep(REBOOT_DELAY)
+        supervisor.reload()
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
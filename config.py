@@ -10,255 +10,304 @@ Provides:
 __version__ = "1.1.0"
 
 import json
-import board
-import time
-import supervisor
 import os
 
-try:
-    from adafruit_hid.keycode import Keycode
-    HAS_KEYCODE = True
-except ImportError:
-    HAS_KEYCODE = False
-    class Keycode:
+def _probe_libraries():
+    # One combined attempt covers the usual case where every library is installed
+    try:
+        from adafruit_hid.keycode import Keycode
+        from adafruit_hid.consumer_control_code import ConsumerControlCode
+        import adafruit_irremote
+        return Keycode, ConsumerControlCode, True
+    except ImportError:
         pass
 
-try:
-    from adafruit_hid.consumer_control_code import ConsumerControlCode
-    HAS_CONSUMER = True
-except ImportError:
-    HAS_CONSUMER = False
-    class ConsumerControlCode:
+    keycode = None
+    consumer_control_code = None
+    has_irremote = False
+    try:
+        from adafruit_hid.keycode import Keycode as keycode
+    except ImportError:
         pass
+    try:
+        from adafruit_hid.consumer_control_code import ConsumerControlCode as consumer_control_code
+    except ImportError:
+        pass
+    try:
+        import adafruit_irremote
+        has_irremote = True
+    except ImportError:
+        pass
+    return keycode, consumer_control_code, has_irremote
 
-try:
-    import adafruit_irremote
-    HAS_IRREMOTE = True
-except ImportError:
-    HAS_IRREMOTE = False
+Keycode, ConsumerControlCode, HAS_IRREMOTE = _probe_libraries()
+HAS_KEYCODE = Keycode is not None
+HAS_CONSUMER = ConsumerControlCode is not None
 
-MEDIA_KEYS = []
+# Key tables are parallel tuples: entry i of *_NAMES is sent with entry i of *_CODES
+MEDIA_KEY_NAMES = ()
+MEDIA_KEY_CODES = ()
 if HAS_CONSUMER:
-    MEDIA_KEYS = [
-        ("Play/Pause", ConsumerControlCode.PLAY_PAUSE, True),
-        ("Stop", ConsumerControlCode.STOP, True),
-        ("Next", ConsumerControlCode.SCAN_NEXT_TRACK, True),
-        ("Prev", ConsumerControlCode.SCAN_PREVIOUS_TRACK, True),
-        ("Vol+", ConsumerControlCode.VOLUME_INCREMENT, True),
-        ("Vol-", ConsumerControlCode.VOLUME_DECREMENT, True),
-        ("Mute", ConsumerControlCode.MUTE, True),
-        ("Record", ConsumerControlCode.RECORD, True),
-        ("FFwd", ConsumerControlCode.FAST_FORWARD, True),
-        ("Rewind", ConsumerControlCode.REWIND, True),
-        ("Eject", ConsumerControlCode.EJECT, True),
-        ("Bright+", ConsumerControlCode.BRIGHTNESS_INCREMENT, True),
-        ("Bright-", ConsumerControlCode.BRIGHTNESS_DECREMENT, True),
-    ]
-
-KEYBOARD_KEYS = []
+    MEDIA_KEY_NAMES = (
+        "Play/Pause", "Stop", "Next", "Prev", "Vol+", "Vol-", "Mute", "Record", "FFwd", "Rewind",
+        "Eject", "Bright+", "Bright-",
+    )
+    MEDIA_KEY_CODES = (
+        ConsumerControlCode.PLAY_PAUSE, ConsumerControlCode.STOP,
+        ConsumerControlCode.SCAN_NEXT_TRACK, ConsumerControlCode.SCAN_PREVIOUS_TRACK,
+        ConsumerControlCode.VOLUME_INCREMENT, ConsumerControlCode.VOLUME_DECREMENT,
+        ConsumerControlCode.MUTE, ConsumerControlCode.RECORD, ConsumerControlCode.FAST_FORWARD,
+        ConsumerControlCode.REWIND, ConsumerControlCode.EJECT,
+        ConsumerControlCode.BRIGHTNESS_INCREMENT, ConsumerControlCode.BRIGHTNESS_DECREMENT,
+    )
+
+KEYBOARD_KEY_NAMES = ()
+KEYBOARD_KEY_CODES = ()
 if HAS_KEYCODE:
-    KEYBOARD_KEYS = [
+    KEYBOARD_KEY_NAMES = (
+        # Letters
+        "a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m", "n", "o", "p", "q", "r",
+        "s", "t", "u", "v", "w", "x", "y", "z",
+        # Numbers
+        "0", "1", "2", "3", "4", "5", "6", "7", "8", "9",
+        # Common Symbols
+        " ", "-", "=", "[", "]", "\\", ";", "'", ",", ".", "/", "`",
+        # Shifted Symbols
+        "~", "!", "@", "#", "$", "%", "^", "&", "*", "(", ")", "_", "+", "{", "}", "|", ":", "\"",
+        "<", ">", "?",
+        # Control Keys
+        "Enter", "Esc", "Bksp", "Tab", "CapsLk",
+        # Modifiers
+        "Ctrl", "Shift", "Alt", "GUI",
+        # Function Keys
+        "F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "F9", "F10", "F11", "F12",
+        # Navigation Keys
+        "Ins", "Del", "Home", "End", "PgUp", "PgDn", "Up", "Down", "Left", "Right",
+        # Keypad Keys
+        "NumLk", "KP /", "KP *", "KP -", "KP +", "KP Ent", "KP 1", "KP 2", "KP 3", "KP 4", "KP 5",
+        "KP 6", "KP 7", "KP 8", "KP 9", "KP 0", "KP .",
+    )
+    KEYBOARD_KEY_CODES = (
         # Letters
-        ("a", Keycode.A), ("b", Keycode.B), ("c", Keycode.C), ("d", Keycode.D), ("e", Keycode.E),
-        ("f", Keycode.F), ("g", Keycode.G), ("h", Keycode.H), ("i", Keycode.I), ("j", Keycode.J),
-        ("k", Keycode.K), ("l", Keycode.L), ("m", Keycode.M), ("n", Keycode.N), ("o", Keycode.O),
-        ("p", Keycode.P), ("q", Keycode.Q), ("r", Keycode.R), ("s", Keycode.S), ("t", Keycode.T),
-        ("u", Keycode.U), ("v", Keycode.V), ("w", Keycode.W), ("x", Keycode.X), ("y", Keycode.Y),
-        ("z", Keycode.Z),
+        Keycode.A, Keycode.B, Keycode.C, Keycode.D, Keycode.E, Keycode.F, Keycode.G, Keycode.H,
+        Keycode.I, Keycode.J, Keycode.K, Keycode.L, Keycode.M, Keycode.N, Keycode.O, Keycode.P,
+        Keycode.Q, Keycode.R, Keycode.S, Keycode.T, Keycode.U, Keycode.V, Keycode.W, Keycode.X,
+        Keycode.Y, Keycode.Z,
         # Numbers
-        ("0", Keycode.ZERO), ("1", Keycode.ONE), ("2", Keycode.TWO), ("3", Keycode.THREE),
-        ("4", Keycode.FOUR), ("5", Keycode.FIVE), ("6", Keycode.SIX), ("7", Keycode.SEVEN),
-        ("8", Keycode.EIGHT), ("9", Keycode.NINE),
+        Keycode.ZERO, Keycode.ONE, Keycode.TWO, Keycode.THREE, Keycode.FOUR, Keycode.FIVE,
+        Keycode.SIX, Keycode.SEVEN, Keycode.EIGHT, Keycode.NINE,
         # Common Symbols
-        (" ", Keycode.SPACE), ("-", Keycode.MINUS), ("=", Keycode.EQUALS),
-        ("[", Keycode.LEFT_BRACKET), ("]", Keycode.RIGHT_BRACKET), ("\\", Keycode.BACKSLASH),
-        (";", Keycode.SEMICOLON), ("'", Keycode.QUOTE), (",", Keycode.COMMA),
-        (".", Keycode.PERIOD), ("/", Keycode.FORWARD_SLASH), ("`", Keycode.GRAVE_ACCENT),
+        Keycode.SPACE, Keycode.MINUS, Keycode.EQUALS, Keycode.LEFT_BRACKET, Keycode.RIGHT_BRACKET,
+        Keycode.BACKSLASH, Keycode.SEMICOLON, Keycode.QUOTE, Keycode.COMMA, Keycode.PERIOD,
+        Keycode.FORWARD_SLASH, Keycode.GRAVE_ACCENT,
         # Shifted Symbols
-        ("~", (Keycode.SHIFT, Keycode.GRAVE_ACCENT)), ("!", (Keycode.SHIFT, Keycode.ONE)),
-        ("@", (Keycode.SHIFT, Keycode.TWO)), ("#", (Keycode.SHIFT, Keycode.THREE)),
-        ("$", (Keycode.SHIFT, Keycode.FOUR)), ("%", (Keycode.SHIFT, Keycode.FIVE)),
-        ("^", (Keycode.SHIFT, Keycode.SIX)), ("&", (Keycode.SHIFT, Keycode.SEVEN)),
-        ("*", (Keycode.SHIFT, Keycode.EIGHT)), ("(", (Keycode.SHIFT, Keycode.NINE)),
-        (")", (Keycode.SHIFT, Keycode.ZERO)), ("_", (Keycode.SHIFT, Keycode.MINUS)),
-        ("+", (Keycode.SHIFT, Keycode.EQUALS)),
-        ("{", (Keycode.SHIFT, Keycode.LEFT_BRACKET)),
-        ("}", (Keycode.SHIFT, Keycode.RIGHT_BRACKET)),
-        ("|", (Keycode.SHIFT, Keycode.BACKSLASH)),
-        (":", (Keycode.SHIFT, Keycode.SEMICOLON)),
-        ("\"", (Keycode.SHIFT, Keycode.QUOTE)),
-        ("<", (Keycode.SHIFT, Keycode.COMMA)),
-        (">", (Keycode.SHIFT, Keycode.PERIOD)),
-        ("?", (Keycode.SHIFT, Keycode.FORWARD_SLASH)),
+        (Keycode.SHIFT, Keycode.GRAVE_ACCENT), (Keycode.SHIFT, Keycode.ONE),
+        (Keycode.SHIFT, Keycode.TWO), (Keycode.SHIFT, Keycode.THREE), (Keycode.SHIFT, Keycode.FOUR),
+        (Keycode.SHIFT, Keycode.FIVE), (Keycode.SHIFT, Keycode.SIX), (Keycode.SHIFT, Keycode.SEVEN),
+        (Keycode.SHIFT, Keycode.EIGHT), (Keycode.SHIFT, Keycode.NINE),
+        (Keycode.SHIFT, Keycode.ZERO), (Keycode.SHIFT, Keycode.MINUS),
+        (Keycode.SHIFT, Keycode.EQUALS), (Keycode.SHIFT, Keycode.LEFT_BRACKET),
+        (Keycode.SHIFT, Keycode.RIGHT_BRACKET), (Keycode.SHIFT, Keycode.BACKSLASH),
+        (Keycode.SHIFT, Keycode.SEMICOLON), (Keycode.SHIFT, Keycode.QUOTE),
+        (Keycode.SHIFT, Keycode.COMMA), (Keycode.SHIFT, Keycode.PERIOD),
+        (Keycode.SHIFT, Keycode.FORWARD_SLASH),
         # Control Keys
-        ("Enter", Keycode.ENTER), ("Esc", Keycode.ESCAPE), ("Bksp", Keycode.BACKSPACE),
-        ("Tab", Keycode.TAB), ("CapsLk", Keycode.CAPS_LOCK),
+        Keycode.ENTER, Keycode.ESCAPE, Keycode.BACKSPACE, Keycode.TAB, Keycode.CAPS_LOCK,
         # Modifiers
-        ("Ctrl", Keycode.LEFT_CONTROL), ("Shift", Keycode.LEFT_SHIFT),
-        ("Alt", Keycode.LEFT_ALT), ("GUI", Keycode.LEFT_GUI),
+        Keycode.LEFT_CONTROL, Keycode.LEFT_SHIFT, Keycode.LEFT_ALT, Keycode.LEFT_GUI,
         # Function Keys
-        ("F1", Keycode.F1), ("F2", Keycode.F2), ("F3", Keycode.F3), ("F4", Keycode.F4),
-        ("F5", Keycode.F5), ("F6", Keycode.F6), ("F7", Keycode.F7), ("F8", Keycode.F8),
-        ("F9", Keycode.F9), ("F10", Keycode.F10), ("F11", Keycode.F11), ("F12", Keycode.F12),
+        Keycode.F1, Keycode.F2, Keycode.F3, Keycode.F4, Keycode.F5, Keycode.F6, Keycode.F7,
+        Keycode.F8, Keycode.F9, Keycode.F10, Keycode.F11, Keycode.F12,
         # Navigation Keys
-        ("Ins", Keycode.INSERT), ("Del", Keycode.DELETE), ("Home", Keycode.HOME),
-        ("End", Keycode.END), ("PgUp", Keycode.PAGE_UP), ("PgDn", Keycode.PAGE_DOWN),
-        ("Up", Keycode.UP_ARROW), ("Down", Keycode.DOWN_ARROW),
-        ("Left", Keycode.LEFT_ARROW), ("Right", Keycode.RIGHT_ARROW),
+        Keycode.INSERT, Keycode.DELETE, Keycode.HOME, Keycode.END, Keycode.PAGE_UP,
+        Keycode.PAGE_DOWN, Keycode.UP_ARROW, Keycode.DOWN_ARROW, Keycode.LEFT_ARROW,
+        Keycode.RIGHT_ARROW,
         # Keypad Keys
-        ("NumLk", Keycode.KEYPAD_NUMLOCK),
-        ("KP /", Keycode.KEYPAD_FORWARD_SLASH), ("KP *", Keycode.KEYPAD_ASTERISK),
-        ("KP -", Keycode.KEYPAD_MINUS), ("KP +", Keycode.KEYPAD_PLUS),
-        ("KP Ent", Keycode.KEYPAD_ENTER),
-        ("KP 1", Keycode.KEYPAD_ONE), ("KP 2", Keycode.KEYPAD_TWO), ("KP 3", Keycode.KEYPAD_THREE),
-        ("KP 4", Keycode.KEYPAD_FOUR), ("KP 5", Keycode.KEYPAD_FIVE), ("KP 6", Keycode.KEYPAD_SIX),
-        ("KP 7", Keycode.KEYPAD_SEVEN), ("KP 8", Keycode.KEYPAD_EIGHT), ("KP 9", Keycode.KEYPAD_NINE),
-        ("KP 0", Keycode.KEYPAD_ZERO), ("KP .", Keycode.KEYPAD_PERIOD),
-    ]
-
-FALLBACK_KEY_SEQUENCE = [
-    ("Play/Pause", None), ("Stop", None), ("Next", None), ("Prev", None), 
-    ("Vol+", None), ("Vol-", None), ("Mute", None),
-    ("a", None), ("b", None), ("c", None),
-    ("Enter", None), ("Space", None), ("Esc", None),
-    ("Up", None), ("Down", None), ("Left", None), ("Right", None),
-]
-
-ALL_KEYS_FOR_MAPPING = MEDIA_KEYS + KEYBOARD_KEYS
-if not HAS_KEYCODE and not HAS_CONSUMER:
-    ALL_KEYS_FOR_MAPPING = FALLBACK_KEY_SEQUENCE
-
-COMMAND_NAME_TO_KEYCODE = {}
-for item in ALL_KEYS_FOR_MAPPING:
-    if len(item) == 2:
-        name, code = item[0], item[1]
-        COMMAND_NAME_TO_KEYCODE[name.lower()] = code 
-    elif len(item) == 3:
-        name, code, is_media_key = item
-        COMMAND_NAME_TO_KEYCODE[name.lower()] = (name, code, is_media_key)
-
-class Colors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    ERROR = '\033[91m'
-    WAIT = '\033[96m'
-    ENDC = '\033[0m'
+        Keycode.KEYPAD_NUMLOCK, Keycode.KEYPAD_FORWARD_SLASH, Keycode.KEYPAD_ASTERISK,
+        Keycode.KEYPAD_MINUS, Keycode.KEYPAD_PLUS, Keycode.KEYPAD_ENTER, Keycode.KEYPAD_ONE,
+        Keycode.KEYPAD_TWO, Keycode.KEYPAD_THREE, Keycode.KEYPAD_FOUR, Keycode.KEYPAD_FIVE,
+        Keycode.KEYPAD_SIX, Keycode.KEYPAD_SEVEN, Keycode.KEYPAD_EIGHT, Keycode.KEYPAD_NINE,
+        Keycode.KEYPAD_ZERO, Keycode.KEYPAD_PERIOD,
+    )
+
+def build_command_map():
+    command_map = {}
+    for i, name in enumerate(MEDIA_KEY_NAMES):
+        command_map[name.lower()] = (name, MEDIA_KEY_CODES[i], True)
+    for i, name in enumerate(KEYBOARD_KEY_NAMES):
+        command_map[name.lower()] = KEYBOARD_KEY_CODES[i]
+    return command_map
+
+# _keymap.py is generated by tools/gen_keymap.py; rebuild at import only if it is missing
+COMMAND_NAME_TO_KEYCODE = None
+if HAS_KEYCODE and HAS_CONSUMER:
+    try:
+        from _keymap import COMMAND_NAME_TO_KEYCODE
+    except ImportError:
+        pass
+if COMMAND_NAME_TO_KEYCODE is None:
+    COMMAND_NAME_TO_KEYCODE = build_command_map()
+
+COLOR_OKBLUE = '\033[94m'
+COLOR_OKGREEN = '\033[92m'
+COLOR_WARNING = '\033[93m'
+COLOR_ERROR = '\033[91m'
+COLOR_WAIT = '\033[96m'
+COLOR_ENDC = '\033[0m'
+
+LOG_DEBUG = 0
+LOG_INFO = 1
+LOG_WAIT = 2
+LOG_OK = 3
+LOG_WARNING = 4
+LOG_ERROR = 5
+
+_LEVEL_NAMES = ("DEBUG", "INFO", "WAIT", "OK", "WARNING", "ERROR")
+_LEVEL_COLORS = (COLOR_ENDC, COLOR_OKBLUE, COLOR_WAIT, COLOR_OKGREEN, COLOR_WARNING, COLOR_ERROR)
+_LEVEL_PREFIXES = tuple(f"{color}[{name}] " for color, name in zip(_LEVEL_COLORS, _LEVEL_NAMES))
+
+def _noop(*args, **kwargs):
+    pass
 
 class Logger:
     def __init__(self, enabled=True, level="INFO"):
         self.enabled = enabled
-        self.levels = {
-            "DEBUG": 0,
-            "INFO": 1,
-            "WAIT": 2,
-            "OK": 3,
-            "WARNING": 4,
-            "ERROR": 5,
-        }
+        if isinstance(level, str):
+            level = _LEVEL_NAMES.index(level)
         self.level = level
+        self._thresh = level
+        if not enabled:
+            self.debug = self.info = self.wait = self.ok = self.warning = self.error = _noop
 
-    def _log(self, level, module, message, **kwargs):
-        if not self.enabled or self.levels[level] < self.levels[self.level]:
-            return
-
-        color_map = {
-            "DEBUG": Colors.ENDC,
-            "INFO": Colors.OKBLUE,
-            "WAIT": Colors.WAIT,
-            "OK": Colors.OKGREEN,
-            "WARNING": Colors.WARNING,
-            "ERROR": Colors.ERROR,
-        }
-        color = color_map.get(level, Colors.ENDC)
+    def _emit(self, level, module, message, args, kwargs):
+        if args:
+            message = message % args
 
-        message_str = f"{color}[{level}] {module}: {message}{Colors.ENDC}"
+        message_str = _LEVEL_PREFIXES[level] + module + ": " + message + COLOR_ENDC
         if kwargs:
             extras = ', '.join(f"{k}={v}" for k, v in kwargs.items())
             message_str += f" ({extras})"
         print(message_str)
 
-    def debug(self, module, message, **kwargs):
-        self._log("DEBUG", module, message, **kwargs)
+    def debug(self, module, message, *args, **kwargs):
+        if not self.enabled or LOG_DEBUG < self._thresh:
+            return
+        self._emit(LOG_DEBUG, module, message, args, kwargs)
 
-    def info(self, module, message, **kwargs):
-        self._log("INFO", module, message, **kwargs)
+    def info(self, module, message, *args, **kwargs):
+        if not self.enabled or LOG_INFO < self._thresh:
+            return
+        self._emit(LOG_INFO, module, message, args, kwargs)
 
-    def wait(self, module, message, **kwargs):
-        self._log("WAIT", module, message, **kwargs)
+    def wait(self, module, message, *args, **kwargs):
+        if not self.enabled or LOG_WAIT < self._thresh:
+            return
+        self._emit(LOG_WAIT, module, message, args, kwargs)
 
-    def ok(self, module, message, **kwargs):
-        self._log("OK", module, message, **kwargs)
+    def ok(self, module, message, *args, **kwargs):
+        if not self.enabled or LOG_OK < self._thresh:
+            return
+        self._emit(LOG_OK, module, message, args, kwargs)
 
-    def warning(self, module, message, **kwargs):
-        self._log("WARNING", module, message, **kwargs)
+    def warning(self, module, message, *args, **kwargs):
+        if not self.enabled or LOG_WARNING < self._thresh:
+            return
+        self._emit(LOG_WARNING, module, message, args, kwargs)
 
-    def error(self, module, message, error=None, **kwargs):
+    def error(self, module, message, *args, error=None, **kwargs):
+        if not self.enabled or LOG_ERROR < self._thresh:
+            return
         if error and "error" not in kwargs:
             kwargs["error"] = str(error)
-        self._log("ERROR", module, message, **kwargs)
+        self._emit(LOG_ERROR, module, message, args, kwargs)
+
+_DEFAULTS = {
+    "display": {
+        "pins": {
+            "ir_receiver": "GP15",
+            "rotary_encoder": {"clk": "GP12", "dt": "GP13", "sw": "GP14"},
+            "i2c": {"sda": "GP20", "scl": "GP21"}
+        },
+        "preferences": {
+            "display_enabled": True,
+            "display_address": 60,
+            "i2c_frequency": 400000,
+            "pin_pull_up": True,
+            "display_rotation": 180
+        }
+    },
+    "status_leds": {
+        "main_led": {"pin": "GP25", "is_inverted": False}
+    },
+    "hid_mapper": {
+        "timing": {
+            "feedback_duration": 0.3,
+            "led_blink_count": 2,
+            "debounce_time": 0.05,
+            "long_press_delay": 1.5,
+            "ir_timeout": 20000,
+            "save_timeout": 30,
+            "reboot_delay": 5,
+            "temp_message_duration": 2.0
+        },
+        "logging": {
+            "default_log_level": "INFO"
+        }
+    },
+    "ir_receiver": {
+        "maxlen": 250,
+        "idle_state": True
+    }
+}
+
+def _copy_tree(tree):
+    return {key: _copy_tree(value) if isinstance(value, dict) else value for key, value in tree.items()}
 
 class Settings:
     def __init__(self):
         self.settings = {}
-        self.defaults = {
-            "display": {
-                "pins": {
-                    "ir_receiver": "GP15",
-                    "rotary_encoder": {"clk": "GP12", "dt": "GP13", "sw": "GP14"},
-                    "i2c": {"sda": "GP20", "scl": "GP21"}
-                },
-                "preferences": {
-                    "display_enabled": True,
-                    "display_address": 60,
-                    "pin_pull_up": True,
-                    "display_rotation": 180
-                }
-            },
-            "status_leds": {
-                "main_led": {"pin": "GP25", "is_inverted": False}
-            },
-            "hid_mapper": {
-                "timing": {
-                    "feedback_duration": 0.3,
-                    "led_blink_count": 2,
-                    "debounce_time": 0.05,
-                    "long_press_delay": 1.5,
-                    "ir_timeout": 20000,
-                    "save_timeout": 30,
-                    "reboot_delay": 5,
-                    "temp_message_duration": 2.0
-                },
-                "logging": {
-                    "default_log_level": "INFO"
-                }
-            },
-            "ir_receiver": {
-                "maxlen": 250,
-                "idle_state": True
-            }
-        }
+        self.defaults = _DEFAULTS
+        self._flat = {}
         self._load_settings()
+        self._build_flat_index()
 
     def _load_settings(self):
+        self.settings = self.defaults
         try:
-            if "settings.json" in os.listdir("/"):
-                with open("/settings.json", "r") as f:
-                    loaded_settings = json.load(f)
-                self._merge_dicts(self.defaults, loaded_settings)
-                self.settings = self.defaults
-            else:
-                self.settings = self.defaults
+            os.stat("/settings.json")
+            with open("/settings.json", "r") as f:
+                loaded_settings = json.load(f)
+            merged = _copy_tree(self.defaults)
+            self._merge_dicts(merged, loaded_settings)
+            self.settings = merged
         except:
-            self.settings = self.defaults
+            pass
 
     def _merge_dicts(self, base, updates):
-        for key, value in updates.items():
-            if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-                self._merge_dicts(base[key], value)
-            else:
-                base[key] = value
+        stack = [(base, updates)]
+        while stack:
+            base, updates = stack.pop()
+            for key, value in updates.items():
+                if type(value) is dict and type(base.get(key)) is dict:
+                    stack.append((base[key], value))
+                else:
+                    base[key] = value
+
+    def _build_flat_index(self):
+        # Maps (section, "key") and (section, "nested.key") to values for single-lookup get_value
+        flat = {}
+        for section_key, section in self.settings.items():
+            if not isinstance(section, dict):
+                continue
+            stack = [("", section)]
+            while stack:
+                prefix, node = stack.pop()
+                for key, value in node.items():
+                    flat_key = prefix + key
+                    flat[(section_key, flat_key)] = value
+                    if isinstance(value, dict):
+                        stack.append((flat_key + ".", value))
+        self._flat = flat
 
     def get(self, key, default=None):
         return self.settings.get(key, default)
@@ -267,8 +316,7 @@ class Settings:
         return self.settings.get(section_key, default if default is not None else {})
 
     def get_value(self, section_key, value_key, default=None):
-        section = self.get_section(section_key)
-        return section.get(value_key, default)
+        return self._flat.get((section_key, value_key), default)
 
 settings = Settings()
 
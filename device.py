@@ -5,8 +5,11 @@ IR signal handling, and display management.
 """
 
 import time
+import errno
+import binascii
 import board
 import digitalio
+import keypad
 import pulseio
 import rotaryio
 import busio
@@ -14,15 +17,17 @@ import displayio
 import terminalio
 import gc
 import os
+import storage
 import supervisor
+from micropython import const
 
 from config import (
     settings, logger, __version__,
-    MEDIA_KEYS, KEYBOARD_KEYS, ALL_KEYS_FOR_MAPPING, COMMAND_NAME_TO_KEYCODE,
+    MEDIA_KEY_NAMES, KEYBOARD_KEY_NAMES, COMMAND_NAME_TO_KEYCODE,
     HAS_KEYCODE, HAS_CONSUMER, HAS_IRREMOTE
 )
 
-from ir_manager import IRManager
+from ir_manager import IRManager, IRMappingTable
 
 try:
     import adafruit_irremote
@@ -34,50 +39,122 @@ except ImportError:
     HAS_HID = False
 
 try:
-    from adafruit_display_text import label
+    # One bitmap per label instead of one TileGrid per glyph
+    from adafruit_display_text import bitmap_label as label
     import adafruit_displayio_ssd1306
     HAS_DISPLAY = True
 except ImportError:
     HAS_DISPLAY = False
 
+def _exists(path):
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+def _build_key_lookup():
+    """Map key names to (press args, is_media), also under their '_' file form"""
+    lookup = {}
+    for name, key_code in COMMAND_NAME_TO_KEYCODE.items():
+        if isinstance(key_code, tuple) and len(key_code) == 3 and key_code[2]:
+            lookup[name] = (key_code[1], True)
+        elif isinstance(key_code, tuple):
+            lookup[name] = (key_code, False)
+        else:
+            lookup[name] = ((key_code,), False)
+    for name in tuple(lookup):
+        if "/" in name:
+            alt_name = name.replace("/", "_")
+            if alt_name not in lookup:
+                lookup[alt_name] = lookup[name]
+    return lookup
+
+def _display_key(key_name):
+    return key_name.upper() if len(key_name) == 1 and 'a' <= key_name <= 'z' else key_name
+
+_LBL_W = const(8)
+_LBL_GAP = const(3)
+_INFO_Y = const(58)  # baseline of the bottom text line on every screen
+_WHITE = const(0xFFFFFF)
+_BLACK = const(0x000000)
+
+def _layout_row(prev_text, curr_text):
+    """x positions of the current and next labels in the key row"""
+    x_curr = len(prev_text) * _LBL_W + _LBL_GAP
+    return x_curr, x_curr + len(curr_text) * _LBL_W + _LBL_GAP
+
+def _clip(text, n=21):
+    return text if len(text) <= n else text[:n]
+
+def _key_group(group_name, key_names):
+    """(name, key names, display names, lowercased names) for one encoder group"""
+    return (group_name, key_names,
+            tuple(_display_key(k) for k in key_names),
+            tuple(k.lower() for k in key_names))
+
+def _set_label(lbl, text, x=None):
+    if lbl.text != text:
+        lbl.text = text
+    if x is not None and lbl.x != x:
+        lbl.x = x
+
+def _set_label_right(lbl, text, right):
+    """Right-align text to end at x=right; position is only recomputed when the text changes"""
+    if lbl.text != text:
+        lbl.text = text
+        box = lbl.bounding_box
+        lbl.x = right - box[0] - box[2]
+
+_TICKS_PERIOD = const(1 << 29)
+_TICKS_MAX = const(_TICKS_PERIOD - 1)
+_TICKS_HALFPERIOD = const(_TICKS_PERIOD // 2)
+
+_DEEP_IDLE_REFRESH_MS = const(1000)
+_USB_CHECK_MS = const(5000)
+# Re-poll interval while an IR burst is arriving; longer than NEC's 4.5ms
+# leader space so a frame cannot look settled halfway through
+_IR_SETTLE_S = 0.006
+
+def _ticks_diff(ticks1, ticks2):
+    """Signed difference between two supervisor.ticks_ms() values, wrap-safe"""
+    diff = (ticks1 - ticks2) & _TICKS_MAX
+    return ((diff + _TICKS_HALFPERIOD) & _TICKS_MAX) - _TICKS_HALFPERIOD
+
 class ButtonDebouncer:
-    def __init__(self, pin, pull, short_press_callback=None, long_press_callback=None,
+    """Short/long press detection on top of keypad.Keys native debouncing"""
+
+    def __init__(self, pin, pull_up, short_press_callback=None, long_press_callback=None,
                  debounce_delay=0.05, long_press_delay=1.5):
-        self.button = digitalio.DigitalInOut(pin)
-        self.button.direction = digitalio.Direction.INPUT
-        self.button.pull = pull
-        self.last_state = self.button.value
-        self.debounce_time = time.monotonic()
-        self.debounce_delay = debounce_delay
-        self.long_press_delay = long_press_delay
+        self.keys = keypad.Keys((pin,), value_when_pressed=False, pull=pull_up,
+                                interval=debounce_delay)
+        self._event = keypad.Event()
+        self.long_press_delay_ms = int(long_press_delay * 1000)
         self.short_press_callback = short_press_callback
         self.long_press_callback = long_press_callback
         self.pressed = False
-        self.press_start_time = 0
+        self.press_start_ms = 0
         self.long_press_triggered = False
 
-    def update(self):
+    def update(self, now_ms=None):
         triggered = False
-        current_time = time.monotonic()
-        button_state = self.button.value
+        event = self._event
 
-        if button_state != self.last_state and (current_time - self.debounce_time) >= self.debounce_delay:
-            self.debounce_time = current_time
-            if not button_state:
+        while self.keys.events.get_into(event):
+            if event.pressed:
                 self.pressed = True
-                self.press_start_time = current_time
+                self.press_start_ms = event.timestamp
                 self.long_press_triggered = False
             else:
                 self.pressed = False
                 if not self.long_press_triggered and self.short_press_callback:
-                    press_duration = current_time - self.press_start_time
-                    if press_duration >= self.debounce_delay:
-                         self.short_press_callback()
-                         triggered = True
-            self.last_state = button_state
+                    self.short_press_callback()
+                    triggered = True
 
         if self.pressed and not self.long_press_triggered and self.long_press_callback:
-            if (current_time - self.press_start_time) >= self.long_press_delay:
+            if now_ms is None:
+                now_ms = supervisor.ticks_ms()
+            if _ticks_diff(now_ms, self.press_start_ms) >= self.long_press_delay_ms:
                 self.long_press_callback()
                 self.long_press_triggered = True
                 triggered = True
@@ -88,10 +165,20 @@ class HIDMapperDevice:
     def __init__(self):
         self.led = None
         self.led_inverted = False
+        self._led_polarity = False
+        self._led_schedule = []
+        # Last value written to the LED pin, so _service_led only writes on edges
+        self._led_value = False
         self.encoder = None
         self.encoder_button = None
         self.display = None
+        self.display_is_ready = False
         self.display_group = None
+        self.status_label = None
+        self.prev_label = None
+        self.curr_label = None
+        self.next_label = None
+        self.info_label = None
         self.pulsein = None
         self.decoder = None
         self.keyboard = None
@@ -100,7 +187,12 @@ class HIDMapperDevice:
         self.ir_manager = None
 
         self._display_needs_update = True
-        self._display_count = 0
+        self._last_deep_idle_refresh = supervisor.ticks_ms()
+        self._last_usb_check = self._last_deep_idle_refresh
+        self._last_rendered_state = None
+        self._last_render_key = None
+        self._status_line_key = None
+        self._status_line = ""
 
         self.temp_display_status = None
         self.temp_display_info = None
@@ -111,28 +203,70 @@ class HIDMapperDevice:
         self.in_idle_mode = False
         self.in_deep_idle_mode = False
         self.idle_entry_time = 0
+        self._activity_source = None
+        self._last_ir_time = 0
+        self._last_displayed_second = -1
+        self._last_idle_state = None
+        self._last_deep_idle_dot = None
+        self._deep_idle_cmd_clear_time = 0
         
         self.key_groups = []
-        if MEDIA_KEYS:
-             self.key_groups.append(("Media", MEDIA_KEYS))
-        if KEYBOARD_KEYS:
-             self.key_groups.append(("Keyboard", KEYBOARD_KEYS))
+        if MEDIA_KEY_NAMES:
+             self.key_groups.append(_key_group("Media", MEDIA_KEY_NAMES))
+        if KEYBOARD_KEY_NAMES:
+             self.key_groups.append(_key_group("Keyboard", KEYBOARD_KEY_NAMES))
+        
+        self._valid_key_names = frozenset(
+            name.lower().replace("/", "_") for name in MEDIA_KEY_NAMES + KEYBOARD_KEY_NAMES
+        )
+        
+        self._key_lookup = _build_key_lookup()
         
         self.current_key_group_index = 0
+        self._current_group_name = "No Groups"
+        self._current_key_list = ()
+        self._current_display_names = ()
+        self._current_lower_names = ()
+        self._select_group(0)
         self.current_key_index = 0
+        self._prev_idx = 0
+        self._next_idx = 0
         self.last_encoder_position = 0
+        self._set_key_index(0)
         
-        self.ir_mappings = {}
-        self.in_learning_mode = False
-        self.learning_key_name = None
-        self.learning_start_time = 0
+        self.ir_mappings = IRMappingTable()
+        self._mapped_keys = set()
+        self._mapping_count_text = "Mappings: 0"
+        self._fs_writable = False
+        # 0 when not learning, else 1 + index into _learn_names of the key being learned
+        self._learn_state = 0
+        self._learn_names = ()
+        self._learn_deadline = 0
+        # Nonzero while a learn result is on screen and exit_learn_mode is due at this monotonic_ns
+        self._learn_exit_at = 0
 
         try:
             self.usb_connected = supervisor.runtime.usb_connected
+            self._usb_supported = True
         except:
             self.usb_connected = False
+            self._usb_supported = False
+
+        # Settings are fixed for the life of the device; a change means a reload
+        self._timing = timing = settings.get_section("hid_mapper", {}).get("timing", {})
+        self._feedback_duration = timing.get("feedback_duration", 0.3)
+        self._led_blink_count = timing.get("led_blink_count", 2)
+        self._temp_message_duration = timing.get("temp_message_duration", 0.5)
+        self._ir_timeout_ns = int(timing.get("ir_timeout", 20000)) * 1_000_000
 
         display_prefs = settings.get_section("display", {}).get("preferences", {})
+        self._idle_enabled = display_prefs.get("idle_mode_enabled", True)
+        self._idle_timeout = display_prefs.get("idle_timeout", 30)
+        self._deep_idle_enabled = display_prefs.get("deep_idle_enabled", True)
+        self._deep_idle_timeout = display_prefs.get("deep_idle_timeout", 180)
+        self._idle_display_enabled = display_prefs.get("idle_display_enabled", True)
+        self._idle_display_inverted = display_prefs.get("idle_display_inverted", True)
+        self._deep_idle_display_enabled = display_prefs.get("deep_idle_display_enabled", True)
         start_in_deep_idle = display_prefs.get("start_in_deep_idle", False)
         
         if start_in_deep_idle:
@@ -144,7 +278,6 @@ class HIDMapperDevice:
         self._init_display()
         self._init_rotary_encoder()
         self._init_ir_receiver()
-        self._init_hid()
         self._load_mappings()
         self._ensure_mappings_directory()
         
@@ -152,20 +285,30 @@ class HIDMapperDevice:
                 self._update_deep_idle_display()
         elif self.display:
             self._set_temp_display(f"Picomote IR v{__version__}",
-                                 f"USB: {'Connected' if self.usb_connected else 'Not Connected'}", 3.0)
+                                 f"USB: {'Connected' if self.usb_connected else 'Not Connected'}", 3.0,
+                                 update_now=True)
 
         self._log_device_status()
 
+    @property
+    def in_learning_mode(self):
+        return self._learn_state != 0
+
+    @property
+    def learning_key_name(self):
+        state = self._learn_state
+        return self._learn_names[state - 1] if state else None
+
     def check_usb_status(self):
-        try:
-            current_status = supervisor.runtime.usb_connected
-            if current_status != self.usb_connected:
-                self.usb_connected = current_status
-                if not current_status:
-                    self._set_temp_display("USB Not Connected", "Limited function", 2.0)
-            return current_status
-        except:
+        # Probed once in __init__, so the periodic check needs no exception frame
+        if not self._usb_supported:
             return self.usb_connected
+        current_status = supervisor.runtime.usb_connected
+        if current_status != self.usb_connected:
+            self.usb_connected = current_status
+            if not current_status:
+                self._set_temp_display("USB Not Connected", "Limited function", 2.0)
+        return current_status
 
     def _init_led(self):
         led_config = settings.get_section("status_leds", {}).get("main_led", {})
@@ -174,7 +317,9 @@ class HIDMapperDevice:
             self.led = digitalio.DigitalInOut(pin)
             self.led.direction = digitalio.Direction.OUTPUT
             self.led_inverted = led_config.get("is_inverted", False)
-            self.led.value = self.led_inverted
+            self._led_polarity = bool(self.led_inverted)
+            self._led_value = bool(self.led_inverted)
+            self.led.value = self._led_value
         except:
             self.led = None
 
@@ -202,14 +347,26 @@ class HIDMapperDevice:
             displayio.release_displays()
             sda_pin = getattr(board, sda_pin_name)
             scl_pin = getattr(board, scl_pin_name)
-            i2c = busio.I2C(scl_pin, sda_pin)
+            i2c = busio.I2C(scl_pin, sda_pin, frequency=display_prefs.get("i2c_frequency", 400000))
             display_bus = displayio.I2CDisplay(i2c, device_address=display_prefs.get("display_address", 60))
             self.display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=128, height=64, 
-                                                             rotation=display_prefs.get("display_rotation", 0))
+                                                             rotation=display_prefs.get("display_rotation", 0),
+                                                             auto_refresh=False)
             
             self.display_font = terminalio.FONT
             self.display_is_ready = True
             self.display_group = displayio.Group()
+            font = self.display_font
+            self.status_label = label.Label(font, text=" ", color=_WHITE, x=0, y=10)
+            self.prev_label = label.Label(font, text=" ", color=_WHITE, x=0, y=32)
+            self.curr_label = label.Label(font, text=" ", color=_BLACK, background_color=_WHITE,
+                                          x=0, y=33)
+            self.next_label = label.Label(font, text=" ", color=_WHITE, x=0, y=32)
+            self.info_label = label.Label(font, text=" ", color=_WHITE, x=0, y=_INFO_Y)
+            for lbl in (self.status_label, self.prev_label, self.curr_label,
+                        self.next_label, self.info_label):
+                self.display_group.append(lbl)
+            self._build_idle_groups()
             self.display.root_group = self.display_group
             
             if not self.in_deep_idle_mode:
@@ -218,8 +375,50 @@ class HIDMapperDevice:
             logger.info("Display", "OLED display initialized successfully")
         except Exception as e:
             self.display = None
+            self.display_is_ready = False
             self.display_group = None
-            logger.info("Display", f"Display hardware not detected - running in headless mode")
+            logger.info("Display", "Display hardware not detected - running in headless mode")
+
+    def _build_idle_groups(self):
+        """Build the idle, deep-idle, error and blank screens once; updates only touch label text"""
+        font = self.display_font
+        width = self.display.width
+        height = self.display.height
+
+        self._blank_group = displayio.Group()
+
+        # Ready before anything fails, so the error path never allocates display objects
+        self._error_group = displayio.Group()
+        self._error_label = label.Label(font, text=" ", color=_WHITE, x=0, y=10)
+        self._error_group.append(self._error_label)
+
+        self._idle_group = displayio.Group()
+        if self._idle_display_inverted:
+            text_color = _BLACK
+            bg_palette = displayio.Palette(1)
+            bg_palette[0] = _WHITE
+            self._idle_group.append(displayio.TileGrid(displayio.Bitmap(width, height, 1),
+                                                       pixel_shader=bg_palette))
+        else:
+            text_color = _WHITE
+        self._idle_usb_label = label.Label(font, text=" ", color=text_color, x=6, y=12)
+        self._idle_mappings_label = label.Label(font, text=" ", color=text_color, x=6, y=28)
+        self._idle_countdown_label = label.Label(font, text=" ", color=text_color, x=0, y=_INFO_Y)
+        for lbl in (self._idle_usb_label, self._idle_mappings_label, self._idle_countdown_label):
+            self._idle_group.append(lbl)
+
+        self._deep_idle_group = displayio.Group()
+        self._deep_idle_dot_label = label.Label(font, text=" ", color=_WHITE,
+                                                x=width // 2 - 16, y=height // 2)
+        self._deep_idle_cmd_label = label.Label(font, text=" ", color=_WHITE, x=0, y=_INFO_Y)
+        self._deep_idle_group.append(self._deep_idle_dot_label)
+        self._deep_idle_group.append(self._deep_idle_cmd_label)
+
+    def _show(self, group):
+        display = self.display
+        if display.root_group is not group:
+            display.root_group = group
+        display.refresh()
 
     def _init_rotary_encoder(self):
         encoder_pins = settings.get_section("display", {}).get("pins", {}).get("rotary_encoder", {})
@@ -240,12 +439,12 @@ class HIDMapperDevice:
             self.last_encoder_position = self.encoder.position
 
             display_prefs = settings.get_section("display", {}).get("preferences", {})
-            pull = digitalio.Pull.UP if display_prefs.get("pin_pull_up", True) else digitalio.Pull.DOWN
+            pull_up = display_prefs.get("pin_pull_up", True)
 
-            timing_prefs = settings.get_section("hid_mapper", {}).get("timing", {})
+            timing_prefs = self._timing
 
             self.encoder_button = ButtonDebouncer(
-                sw_pin, pull,
+                sw_pin, pull_up,
                 short_press_callback=self._encoder_short_press_handler,
                 long_press_callback=self._enter_learning_mode_handler,
                 debounce_delay=timing_prefs.get("debounce_time", 0.05),
@@ -277,29 +476,32 @@ class HIDMapperDevice:
             self.pulsein.clear()
             self.decoder = adafruit_irremote.GenericDecode()
             self.ir_manager = IRManager(self.pulsein, self.decoder)
-            logger.info("IR", f"IR receiver initialized successfully on pin {pin_name}")
+            logger.info("IR", "IR receiver initialized successfully on pin %s", pin_name)
         except Exception as e:
             self.pulsein = None
             self.decoder = None
             self.ir_manager = None
-            logger.warning("IR", f"Failed to initialize IR receiver - IR functionality disabled")
+            logger.warning("IR", "Failed to initialize IR receiver - IR functionality disabled")
 
-    def _init_hid(self):
-        if not self.usb_connected or not HAS_HID:
-             return
-        try:
-            self.keyboard = Keyboard(usb_hid.devices)
-            if HAS_CONSUMER:
+    def _get_keyboard(self):
+        if self.keyboard is None and HAS_HID:
+            try:
+                self.keyboard = Keyboard(usb_hid.devices)
+            except:
+                pass
+        return self.keyboard
+
+    def _get_consumer_control(self):
+        if self.consumer_control is None and HAS_HID and HAS_CONSUMER:
+            try:
                 self.consumer_control = ConsumerControl(usb_hid.devices)
-        except:
-            self.keyboard = None
-            self.consumer_control = None
+            except:
+                pass
+        return self.consumer_control
 
     def _remount_rw(self):
         try:
-            import storage
             storage.remount("/", readonly=False)
-            time.sleep(0.2)
             return True
         except:
             return False
@@ -310,7 +512,9 @@ class HIDMapperDevice:
                 return
             
             mapped_count = 0
+            loaded_mappings = {}
             mappings_dir = "/mappings"
+            valid_names = self._valid_key_names
             
             try:
                 files = os.listdir(mappings_dir)
@@ -323,63 +527,106 @@ class HIDMapperDevice:
                 else:
                     return
             
-            ir_files = [f for f in files if f.endswith(".ir")]
-            
-            for filename in ir_files:
+            for filename in files:
+                if len(filename) < 4 or filename[-3:] != ".ir":
+                    continue
+                if valid_names and filename[:-3] not in valid_names:
+                    continue
                 filepath = mappings_dir + "/" + filename
-                key_name = filename[:-3]
-                display_key_name = key_name.replace("_", "/")
                 
                 try:
-                    with open(filepath, "r") as f:
-                        ir_code_hex = f.read().strip()
-                        ir_code = int(ir_code_hex, 16)
-                        self.ir_mappings[ir_code] = display_key_name
-                        mapped_count += 1
-                except:
+                    with open(filepath, "rb") as f:
+                        raw = f.read(11)
+                    if len(raw) == 4:
+                        # Current format: the 32-bit code as raw big-endian bytes
+                        ir_code = int.from_bytes(raw, "big")
+                    elif len(raw) == 10 and raw[:2] == b"0x":
+                        # Files saved by earlier releases: "0x%08x" text
+                        ir_code = int.from_bytes(binascii.unhexlify(raw[2:]), "big")
+                    else:
+                        # Hand-written files may omit the prefix or carry whitespace
+                        ir_code = int(raw.decode().strip(), 16)
+                    # Keys stay in file form ("play_pause"); see handle_ir_signal
+                    loaded_mappings[ir_code] = filename[:-3]
+                    mapped_count += 1
+                except (OSError, ValueError):
                     continue
             
+            self.ir_mappings = IRMappingTable(loaded_mappings)
+            self._mapped_keys = set(self.ir_mappings.values())
+            self._mapping_count_text = f"Mappings: {len(self.ir_mappings)}"
+            loaded_mappings = None
+            gc.collect()
+            
             if self.ir_manager and self.ir_mappings:
                 self.ir_manager.preload_frequent_mappings(self.ir_mappings, max_preload=5)
                 
         except:
             pass
 
+    def _select_group(self, index):
+        """Make key group `index` current and cache its name and key tuples"""
+        self.current_key_group_index = index
+        if self.key_groups:
+            group = self.key_groups[index % len(self.key_groups)]
+            (self._current_group_name, self._current_key_list,
+             self._current_display_names, self._current_lower_names) = group
+
     def _get_current_key_data(self):
-        if not self.key_groups:
-            return "No Groups", []
-        group = self.key_groups[self.current_key_group_index % len(self.key_groups)]
-        return group[0], group[1]
+        return self._current_group_name, self._current_key_list
+
+    def _set_key_index(self, index, total_keys=None):
+        """Set the selected key and the neighbours shown beside it"""
+        if total_keys is None:
+            total_keys = len(self._current_key_list)
+        if not total_keys:
+            self.current_key_index = self._prev_idx = self._next_idx = 0
+            return
+        index %= total_keys
+        self.current_key_index = index
+        self._prev_idx = index - 1 if index else total_keys - 1
+        self._next_idx = index + 1 if index + 1 < total_keys else 0
 
     def update(self):
-        ir_detected = self.handle_ir_signal()
         current_time = time.monotonic()
+        ir_detected = self.handle_ir_signal(current_time)
+
+        now_ms = supervisor.ticks_ms()
+        if self._led_schedule:
+            self._service_led(now_ms)
 
-        self._display_count += 1
+        ir_manager = self.ir_manager
+        if ir_manager and ir_manager.receiving:
+            # Encoder and button input is buffered in C, so the slow lane can skip a tick
+            time.sleep(_IR_SETTLE_S)
+            return
         
         if self.temp_display_expiry > 0 and current_time >= self.temp_display_expiry:
                 self.temp_display_status = None
                 self.temp_display_info = None
                 self.temp_display_expiry = 0.0
-                self._update_display(force_update=True)
+                self._update_display(force_update=True, current_time=current_time)
         
-        self._update_encoder()
+        self._update_encoder(current_time)
         if self.encoder_button:
-            self.encoder_button.update()
+            self.encoder_button.update(now_ms)
             
-        if self.in_deep_idle_mode and self._display_count % 100 == 0:
-            self._update_deep_idle_display()
+        if self.in_deep_idle_mode and _ticks_diff(now_ms, self._last_deep_idle_refresh) >= _DEEP_IDLE_REFRESH_MS:
+            self._last_deep_idle_refresh = now_ms
+            self._update_deep_idle_display(current_time)
         
-        self._check_idle_mode()
+        self._check_idle_mode(current_time)
             
-        if self._display_count % 500 == 0:
+        if _ticks_diff(now_ms, self._last_usb_check) >= _USB_CHECK_MS:
+            self._last_usb_check = now_ms
             self.check_usb_status()
 
-        if self.in_learning_mode:
+        if self._learn_state:
             self.process_learning_mode()
 
-        if self._display_count % 50 == 0 and not self.in_idle_mode:
-            self._update_display()
+        # One flush per tick; temp messages still paint over the idle screen as they always have
+        if self._display_needs_update and (not self.in_idle_mode or self.temp_display_expiry > 0):
+            self._update_display(force_update=self.in_idle_mode, current_time=current_time)
         
         if ir_detected:
             return
@@ -387,87 +634,76 @@ class HIDMapperDevice:
             time.sleep(0.05)
         elif self.in_idle_mode:
             time.sleep(0.02)
-        elif self.in_learning_mode:
+        elif self._learn_state:
             time.sleep(0.01)
         else:
             time.sleep(0.015)
 
-    def _record_activity(self):
-        self.last_activity_time = time.monotonic()
-        activity_source = getattr(self, '_activity_source', None)
+    def _record_activity(self, current_time=None):
+        if current_time is None:
+            current_time = time.monotonic()
+        self.last_activity_time = current_time
+        activity_source = self._activity_source
         
         if (self.in_idle_mode or self.in_deep_idle_mode) and activity_source != 'ir':
             self.in_idle_mode = False
             self.in_deep_idle_mode = False
             
-            current_time = time.monotonic()
             if self.temp_display_expiry > 0 and current_time >= self.temp_display_expiry:
                 self.temp_display_status = None
                 self.temp_display_info = None
                 self.temp_display_expiry = 0.0
             
             self._display_needs_update = True
-            self._update_display(force_update=True)
+            self._update_display(force_update=True, current_time=current_time)
         
         self._activity_source = None
 
-    def _check_idle_mode(self):
-        if self.in_learning_mode or self.temp_display_expiry > 0:
-            self.last_activity_time = time.monotonic()
+    def _check_idle_mode(self, current_time):
+        if self._learn_state or self.temp_display_expiry > 0:
+            self.last_activity_time = current_time
             return
-            
-        current_time = time.monotonic()
-        display_prefs = settings.get_section("display", {}).get("preferences", {})
-        
+
         if self.in_deep_idle_mode:
             return
         
-        idle_enabled = display_prefs.get("idle_mode_enabled", True)
-        if not idle_enabled or not self.display or not self.display_is_ready:
+        if not self._idle_enabled or not self.display_is_ready:
             return
             
         if self.in_idle_mode:
-            deep_idle_enabled = display_prefs.get("deep_idle_enabled", True)
-            deep_idle_timeout = display_prefs.get("deep_idle_timeout", 180)
-            
-            if deep_idle_enabled and (current_time - self.idle_entry_time >= deep_idle_timeout):
+            if self._deep_idle_enabled and (current_time - self.idle_entry_time >= self._deep_idle_timeout):
                 self.in_deep_idle_mode = True
-                self._update_deep_idle_display()
+                gc.collect()
+                self._update_deep_idle_display(current_time)
             else:
                 current_second = int(current_time - self.last_activity_time)
-                if not hasattr(self, '_last_displayed_second') or current_second != self._last_displayed_second:
+                if current_second != self._last_displayed_second:
                     self._last_displayed_second = current_second
-                    if hasattr(self, '_last_idle_countdown'):
-                        delattr(self, '_last_idle_countdown')
-                    self._update_idle_display()
+                    self._last_idle_state = None
+                    self._update_idle_display(current_time)
         else:
-            idle_timeout = display_prefs.get("idle_timeout", 30)
-            if (current_time - self.last_activity_time > idle_timeout):
+            if (current_time - self.last_activity_time > self._idle_timeout):
                 self.in_idle_mode = True
                 self.idle_entry_time = current_time
                 self._last_displayed_second = -1
-                self._update_idle_display()
+                # Nothing is latency sensitive at this edge, so collect here rather than mid-redraw
+                gc.collect()
+                self._update_idle_display(current_time)
 
-    def _update_idle_display(self):
-        if not self.display or not self.display_is_ready or not self.in_idle_mode:
+    def _update_idle_display(self, current_time=None):
+        if not self.display_is_ready or not self.in_idle_mode:
             return
-            
-        display_prefs = settings.get_section("display", {}).get("preferences", {})
-        display_enabled = display_prefs.get("idle_display_enabled", True)
-        inverted_display = display_prefs.get("idle_display_inverted", True)
-        
-        if not display_enabled:
-            self.display.root_group = displayio.Group()
+
+        if not self._idle_display_enabled:
+            self._show(self._blank_group)
             return
         
-        current_time = time.monotonic()
+        if current_time is None:
+            current_time = time.monotonic()
         idle_seconds = int(current_time - self.last_activity_time)
         
-        deep_idle_enabled = display_prefs.get("deep_idle_enabled", True)
-        deep_idle_timeout = display_prefs.get("deep_idle_timeout", 180)
-        
-        if deep_idle_enabled:
-            seconds_until_deep_idle = max(0, deep_idle_timeout - idle_seconds)
+        if self._deep_idle_enabled:
+            seconds_until_deep_idle = max(0, self._deep_idle_timeout - idle_seconds)
             if seconds_until_deep_idle <= 1:
                 countdown_text = "Sleeping..."
             elif seconds_until_deep_idle > 60:
@@ -479,102 +715,79 @@ class HIDMapperDevice:
         else:
             countdown_text = f"Idle: {idle_seconds}s"
         
-        if hasattr(self, '_last_idle_countdown') and self._last_idle_countdown == countdown_text:
+        state = (countdown_text, self.usb_connected, len(self.ir_mappings))
+        if state == self._last_idle_state and self.display.root_group is self._idle_group:
             return
             
-        self._last_idle_countdown = countdown_text
-        
-        temp_group = displayio.Group()
-        font = terminalio.FONT
-        
-        if inverted_display:
-            bg_color = 0xFFFFFF
-            text_color = 0x000000
-            bg_bitmap = displayio.Bitmap(self.display.width, self.display.height, 1)
-            bg_palette = displayio.Palette(1)
-            bg_palette[0] = bg_color
-            bg_rect = displayio.TileGrid(bg_bitmap, pixel_shader=bg_palette)
-            temp_group.append(bg_rect)
-        else:
-            text_color = 0xFFFFFF
-        
-        line_height = 16
-        base_y = 12
-        left_margin = 6
-        
-        usb_status = f"USB: {'Connected' if self.usb_connected else 'Not Connected'}"
-        usb_label = label.Label(font, text=usb_status, color=text_color, x=left_margin, y=base_y)
-        temp_group.append(usb_label)
+        self._last_idle_state = state
         
-        mappings_text = f"Mappings: {len(self.ir_mappings)}"
-        mappings_label = label.Label(font, text=mappings_text, color=text_color, 
-                                   x=left_margin, y=base_y + line_height)
-        temp_group.append(mappings_label)
+        _set_label(self._idle_usb_label, f"USB: {'Connected' if self.usb_connected else 'Not Connected'}")
+        _set_label(self._idle_mappings_label, self._mapping_count_text)
+        _set_label_right(self._idle_countdown_label, countdown_text, self.display.width - 6)
         
-        countdown_width = len(countdown_text) * 6
-        countdown_x = self.display.width - countdown_width - 6
-        countdown_y = 58
-        
-        countdown_label = label.Label(font, text=countdown_text, color=text_color, 
-                                    x=countdown_x, y=countdown_y)
-        temp_group.append(countdown_label)
-        
-        self.display.root_group = temp_group
+        self._show(self._idle_group)
         self._display_needs_update = False
 
-    def _update_encoder(self):
-        if not self.encoder:
+    def _update_encoder(self, current_time=None):
+        encoder = self.encoder
+        if not encoder:
             return
 
-        group_name, current_key_list = self._get_current_key_data()
-            
+        current_key_list = self._current_key_list
         if not current_key_list:
             return
 
-        position = self.encoder.position
+        position = encoder.position
         delta = position - self.last_encoder_position
 
         if delta != 0:
             self._activity_source = 'encoder'
-            self._record_activity()
+            self._record_activity(current_time)
             
-            total_keys = len(current_key_list)
-            self.current_key_index = (self.current_key_index + delta) % total_keys
+            self._set_key_index(self.current_key_index + delta, len(current_key_list))
             self.last_encoder_position = position
             self._display_needs_update = True
-            self._update_display()
         
-    def handle_ir_signal(self):
-        if not self.ir_manager:
+    def handle_ir_signal(self, current_time=None):
+        ir_manager = self.ir_manager
+        if not ir_manager:
             return False
             
-        ir_code = self.ir_manager.get_ir_code()
+        if current_time is None:
+            current_time = time.monotonic()
+        ir_code = ir_manager.get_ir_code()
         if not ir_code:
             return False
             
-        self._last_ir_time = time.monotonic()
+        self._last_ir_time = current_time
         self._activity_source = 'ir'
-        self._record_activity()
-
-        if self.in_learning_mode:
-            if self.learning_key_name:
-                self.save_mapping(ir_code, self.learning_key_name)
+        self._record_activity(current_time)
+
+        if self._learn_state:
+            if self._learn_exit_at:
+                # The previous result is still on screen; let it finish
+                return True
+            learning_key_name = self.learning_key_name
+            if learning_key_name:
+                self.save_mapping(ir_code, learning_key_name)
             else:
                 self.exit_learn_mode()
         else:
-            key_name = self.ir_manager.lookup_mapping(ir_code, self.ir_mappings)
+            key_name = ir_manager.lookup_mapping(ir_code, self.ir_mappings)
+            in_deep_idle = self.in_deep_idle_mode
                         
             if key_name:
-                if self.in_deep_idle_mode:
-                    self._show_ir_command_in_deep_idle(key_name)
+                key_name = key_name.replace("_", "/")
+                if in_deep_idle:
+                    self._show_ir_command_in_deep_idle(key_name, current_time)
                 else:
-                    self._set_temp_display("Sending", f"{key_name}", 0.5)
+                    self._set_temp_display("Sending", key_name, 0.5)
                 
                 self._send_hid_key(key_name)
                 self.visual_feedback(True, 0.1, blink_count=1)
             else:
-                if self.in_deep_idle_mode:
-                    self._show_ir_command_in_deep_idle("Not Mapped")
+                if in_deep_idle:
+                    self._show_ir_command_in_deep_idle("Not Mapped", current_time)
                 else:
                     self._set_temp_display("IR Received", "Not Mapped", 0.5)
                 
@@ -582,72 +795,57 @@ class HIDMapperDevice:
         
         return True
 
-    def _show_ir_command_in_deep_idle(self, command_text):
-        if not self.display or not self.display_is_ready:
+    def _show_ir_command_in_deep_idle(self, command_text, current_time=None):
+        if not self.display_is_ready:
             return
-            
-        display_prefs = settings.get_section("display", {}).get("preferences", {})
-        if not display_prefs.get("deep_idle_display_enabled", True):
+
+        if not self._deep_idle_display_enabled:
             return
             
-        temp_group = displayio.Group()
-        font = terminalio.FONT
-        
-        current_time = time.monotonic()
+        if current_time is None:
+            current_time = time.monotonic()
         animation_cycle = (current_time * 8) % 2
         dot = "++++" if animation_cycle < 1 else "****"
-            
-        dot_label = label.Label(font, text=dot, color=0xFFFFFF,
-                              x=self.display.width // 2 - 16, y=self.display.height // 2)
-        temp_group.append(dot_label)
         
         max_cmd_length = 18
         if len(command_text) > max_cmd_length:
             command_text = command_text[:max_cmd_length-1] + "…"
-            
-        cmd_width = len(command_text) * 6
-        cmd_x = self.display.width - cmd_width - 4
-        cmd_y = 58
         
-        cmd_label = label.Label(font, text=command_text, color=0xFFFFFF, x=cmd_x, y=cmd_y)
-        temp_group.append(cmd_label)
-            
-        self.display.root_group = temp_group
-        self._deep_idle_cmd_clear_time = time.monotonic() + 2.0
+        _set_label(self._deep_idle_dot_label, dot)
+        _set_label_right(self._deep_idle_cmd_label, command_text, self.display.width - 4)
+        self._show(self._deep_idle_group)
+        self._deep_idle_cmd_clear_time = current_time + 2.0
         self._display_needs_update = False
 
-    def _update_deep_idle_display(self):
-        if not self.display or not self.display_is_ready or not self.in_deep_idle_mode:
+    def _update_deep_idle_display(self, current_time=None):
+        if not self.display_is_ready or not self.in_deep_idle_mode:
             return
             
-        current_time = time.monotonic()
-        if hasattr(self, '_deep_idle_cmd_clear_time') and self._deep_idle_cmd_clear_time > 0:
+        if current_time is None:
+            current_time = time.monotonic()
+        cmd_cleared = False
+        if self._deep_idle_cmd_clear_time > 0:
             if current_time >= self._deep_idle_cmd_clear_time:
                 self._deep_idle_cmd_clear_time = 0
+                cmd_cleared = True
             else:
                 return
-            
-        display_prefs = settings.get_section("display", {}).get("preferences", {})
-        if not display_prefs.get("deep_idle_display_enabled", True):
-            self.display.root_group = displayio.Group()
+
+        if not self._deep_idle_display_enabled:
+            self._show(self._blank_group)
             return
         
         animation_cycle = (current_time * 0.5) % 2
         dot = "++++" if animation_cycle < 1 else "****"
         
-        if hasattr(self, '_last_deep_idle_dot') and self._last_deep_idle_dot == dot:
+        on_screen = self.display.root_group is self._deep_idle_group
+        if on_screen and not cmd_cleared and self._last_deep_idle_dot == dot:
             return
             
         self._last_deep_idle_dot = dot
-            
-        temp_group = displayio.Group()
-        font = terminalio.FONT
-        
-        dot_label = label.Label(font, text=dot, color=0xFFFFFF,
-                              x=self.display.width // 2 - 16, y=self.display.height // 2)
-        temp_group.append(dot_label)
-            
-        self.display.root_group = temp_group
+        _set_label(self._deep_idle_dot_label, dot)
+        _set_label(self._deep_idle_cmd_label, " ")
+        self._show(self._deep_idle_group)
         self._display_needs_update = False
 
     def _encoder_short_press_handler(self):
@@ -658,16 +856,19 @@ class HIDMapperDevice:
              self.visual_feedback(True, 0.05)
              return
         
-        self.current_key_group_index = (self.current_key_group_index + 1) % len(self.key_groups)
-        self.current_key_index = 0
+        self._select_group((self.current_key_group_index + 1) % len(self.key_groups))
+        self._set_key_index(0)
         self.last_encoder_position = self.encoder.position
         
         group_name, _ = self._get_current_key_data()
-        self._set_temp_display(f"Mode: {group_name}", duration=1.0, update_now=False)
+        self._set_temp_display(f"Mode: {group_name}", duration=1.0)
         self.visual_feedback(True, 0.1)
         self._update_display(force_update=True)
 
     def _enter_learning_mode_handler(self):
+        if self._learn_state:
+            return
+
         self._activity_source = 'button'
         self._record_activity()
         
@@ -677,116 +878,105 @@ class HIDMapperDevice:
             self.visual_feedback(True, 0.5, blink_count=2)
             return
 
-        if self.ir_manager:
-            self.ir_manager.reset_debounce()
-
-        if self.in_learning_mode:
+        ir_manager = self.ir_manager
+        if not ir_manager:
+            logger.warning("IR", "IR receiver unavailable - cannot enter learning mode")
+            self._set_temp_display("Learning", "IR unavailable", 1.5)
+            self.visual_feedback(True, 0.5, blink_count=2)
             return
 
-        self.learning_key_name = current_key_list[self.current_key_index][0].lower()
-        self.in_learning_mode = True
-        self.learning_start_time = time.monotonic()
-        if self.ir_manager:
-            self.ir_manager.clear_buffer()
-        self.visual_feedback(True)
-        self._update_display(force_update=True)
+        self._enter_learn_transition(ir_manager, self._current_lower_names, self.current_key_index)
 
-    def _update_display(self, force_update=False, status=None, info=None):
-        try:
-            if not self.display or not self.display_is_ready:
-                return
-                
-            if (self.in_idle_mode or self.in_deep_idle_mode) and not force_update:
-                return
-                
-            current_time = time.monotonic()
-            if self.temp_display_expiry > 0 and current_time >= self.temp_display_expiry:
-                self.temp_display_status = None
-                self.temp_display_info = None
-                self.temp_display_expiry = 0.0
-                self._display_needs_update = True
-                force_update = True
+    def _enter_learn_transition(self, ir_manager, key_names, key_index):
+        """All side effects of entering learn mode, in one place and in order"""
+        self._learn_names = key_names
+        self._learn_state = key_index + 1
+        self._learn_deadline = time.monotonic_ns() + self._ir_timeout_ns
+        ir_manager.reset_debounce()
+        ir_manager.clear_buffer()
+        self.visual_feedback(True)
+        # Picked up by the single flush at the end of update()
+        self._display_needs_update = True
 
-            needs_update = force_update or self._display_needs_update or (self._display_count % 50 == 0)
-            if not needs_update:
-                return
-            
-            temp_group = displayio.Group()
-            font = terminalio.FONT
+    def _update_display(self, force_update=False, status=None, info=None, current_time=None):
+        if not self.display_is_ready:
+            return
             
-            status_line = (status or self.temp_display_status or self._build_status_line())[:21]
-            status_label = label.Label(font, text=status_line, color=0xFFFFFF, x=0, y=10)
-            temp_group.append(status_label)
+        if (self.in_idle_mode or self.in_deep_idle_mode) and not force_update:
+            return
             
-            group_name, current_key_list = self._get_current_key_data()
-            if not current_key_list:
-                key_line = "NO KEYS IN GROUP"
-                key_label = label.Label(font, text=key_line, color=0xFFFFFF, x=0, y=32)
-                temp_group.append(key_label)
-            else:
-                current_idx = min(self.current_key_index, len(current_key_list) - 1)
-                prev_idx = (current_idx - 1) % len(current_key_list)
-                next_idx = (current_idx + 1) % len(current_key_list)
-                
-                prev_key_orig = current_key_list[prev_idx][0]
-                curr_key_orig = current_key_list[current_idx][0]
-                next_key_orig = current_key_list[next_idx][0]
-
-                def get_display_key(key_name):
-                    return key_name.upper() if len(key_name) == 1 and 'a' <= key_name <= 'z' else key_name
+        if current_time is None:
+            current_time = time.monotonic()
+        if self.temp_display_expiry > 0 and current_time >= self.temp_display_expiry:
+            self.temp_display_status = None
+            self.temp_display_info = None
+            self.temp_display_expiry = 0.0
+            self._display_needs_update = True
+            force_update = True
 
-                prev_key = get_display_key(prev_key_orig)
-                curr_key = get_display_key(curr_key_orig)
-                next_key = get_display_key(next_key_orig)
-                
-                prev_text = f"< {prev_key}"
-                prev_label = label.Label(font, text=prev_text, color=0xFFFFFF, x=0, y=32)
-                temp_group.append(prev_label)
-                
-                curr_text = f"  {curr_key}  "
-                current_x = len(prev_text) * 8 + 3
-                current_y = 32 + 1
-                
-                curr_label = label.Label(font, text=curr_text, color=0x000000, background_color=0xFFFFFF,
-                                       x=current_x, y=current_y)
-                temp_group.append(curr_label)
-                
-                next_text = f"{next_key} >"
-                next_x = current_x + len(curr_text) * 8 + 3
-                next_label = label.Label(font, text=next_text, color=0xFFFFFF, x=next_x, y=32)
-                temp_group.append(next_label)
-            
-            if info:
-                info_line = info[:21]
-            elif self.temp_display_info:
-                info_line = self.temp_display_info[:21]
-            elif self.in_learning_mode and self.learning_remaining_time > 0:
-                info_line = f"Time: {self.learning_remaining_time}s"
+        if not (force_update or self._display_needs_update):
+            return
+        
+        render_key = (self.current_key_group_index, self.current_key_index, self._learn_state,
+                      self.learning_remaining_time, self.temp_display_status, self.temp_display_info,
+                      status, info, len(self.ir_mappings),
+                      self.display.root_group is self.display_group)
+        if not force_update and render_key == self._last_render_key:
+            self._display_needs_update = False
+            return
+        self._last_render_key = render_key
+        
+        status_line = _clip(status or self.temp_display_status or self._build_status_line())
+        
+        current_key_list = self._current_key_list
+        if not current_key_list:
+            prev_text = "NO KEYS IN GROUP"
+            curr_text = ""
+            next_text = ""
+        else:
+            display_names = self._current_display_names
+            prev_text = f"< {display_names[self._prev_idx]}"
+            curr_text = f"  {display_names[self.current_key_index]}  "
+            next_text = f"{display_names[self._next_idx]} >"
+        
+        if info:
+            info_line = _clip(info)
+        elif self.temp_display_info:
+            info_line = _clip(self.temp_display_info)
+        elif self._learn_state and self.learning_remaining_time > 0:
+            info_line = f"Time: {self.learning_remaining_time}s"
+        else:
+            if current_key_list:
+                current_key = self._current_lower_names[self.current_key_index].replace("/", "_")
+                is_mapped = current_key in self._mapped_keys
+                info_line = "Mapped" if is_mapped else "Not Mapped"
             else:
-                if current_key_list:
-                    current_key = current_key_list[self.current_key_index][0].lower()
-                    is_mapped = current_key in self.ir_mappings.values()
-                    info_line = "Mapped" if is_mapped else "Not Mapped"
-                else:
-                    info_line = "NO KEYS IN GROUP"
-            
-            info_width = len(info_line) * 6
-            info_x = self.display.width - info_width - 4
-            info_y = 58
-            
-            info_label = label.Label(font, text=info_line, color=0xFFFFFF, x=info_x, y=info_y)
-            temp_group.append(info_label)
+                info_line = "NO KEYS IN GROUP"
+        
+        state = (status_line, prev_text, curr_text, next_text, info_line)
+        on_screen = self.display.root_group is self.display_group
+        if on_screen and state == self._last_rendered_state:
+            self._display_needs_update = False
+            return
+        
+        # Only the redraw touches hardware; a dead display must not stop IR handling
+        try:
+            _set_label(self.status_label, status_line)
+            if state[1:4] != (self.prev_label.text, self.curr_label.text, self.next_label.text):
+                x_curr, x_next = _layout_row(prev_text, curr_text)
+                _set_label(self.prev_label, prev_text, 0)
+                _set_label(self.curr_label, curr_text, x_curr)
+                _set_label(self.next_label, next_text, x_next)
+            _set_label_right(self.info_label, info_line, self.display.width - 4)
             
-            self.display.root_group = temp_group
+            self._show(self.display_group)
+            self._last_rendered_state = state
             self._display_needs_update = False
 
         except Exception as e:
             try:
-                error_group = displayio.Group()
-                err_msg = f"ERR: {str(e)[:15]}"
-                error_label = label.Label(terminalio.FONT, text=err_msg, color=0xFFFFFF, x=0, y=10)
-                error_group.append(error_label)
-                self.display.root_group = error_group
+                _set_label(self._error_label, f"ERR: {_clip(str(e), 15)}")
+                self._show(self._error_group)
             except:
                 pass
 
@@ -794,64 +984,95 @@ class HIDMapperDevice:
         if not self.led:
             return
 
-        timing = settings.get_section("hid_mapper", {}).get("timing", {})
-        duration = duration or timing.get("feedback_duration", 0.3)
-        blink_count = blink_count or timing.get("led_blink_count", 2)
+        duration = duration or self._feedback_duration
+        blink_count = blink_count or self._led_blink_count
 
-        led_state_on = turn_on if not self.led_inverted else not turn_on
+        led_state_on = bool(turn_on) ^ self._led_polarity
         led_state_off = not led_state_on
 
-        if self.led.value != led_state_off:
-            self.led.value = led_state_off
-            time.sleep(0.01)
-
         if blink_count < 1: 
             blink_count = 1
-        on_time = duration / (blink_count * 2)
-        off_time = duration / (blink_count * 2)
+        half_period_ms = int(duration * 1000) // (blink_count * 2)
 
+        # Queue (ticks_ms deadline, state) toggles for _service_led; None means the resting state.
+        # Integer ticks keep millisecond edges exact, unlike a float32 monotonic() after long uptimes
+        now = supervisor.ticks_ms()
+        t = now
+        schedule = []
         for _ in range(blink_count):
-            self.led.value = led_state_on
-            time.sleep(on_time)
-            self.led.value = led_state_off
-            time.sleep(off_time)
-
-        if self.in_learning_mode:
-            self.led.value = True if not self.led_inverted else False
-        else:
-            self.led.value = False if not self.led_inverted else True
+            schedule.append((t & _TICKS_MAX, led_state_on))
+            t += half_period_ms
+            schedule.append((t & _TICKS_MAX, led_state_off))
+            t += half_period_ms
+        schedule.append((t & _TICKS_MAX, None))
+
+        self._led_schedule = schedule
+        self._service_led(now)
+
+    def _service_led(self, now_ms):
+        schedule = self._led_schedule
+        while schedule and _ticks_diff(now_ms, schedule[0][0]) >= 0:
+            state = schedule.pop(0)[1]
+            if state is None:
+                state = (self._learn_state != 0) ^ self._led_polarity
+            if state != self._led_value:
+                self.led.value = state
+                self._led_value = state
+
+    def _finish_learning(self, seconds):
+        """Leave learn mode once the result message has been shown for `seconds`, without blocking"""
+        self._learn_exit_at = time.monotonic_ns() + int(seconds * 1_000_000_000)
+        self.learning_remaining_time = 0
+        # Keep the result up until exit_learn_mode clears it
+        self.temp_display_expiry = max(self.temp_display_expiry, time.monotonic() + seconds + 0.1)
 
     def _build_status_line(self):
-        if self.in_learning_mode:
-            return "LEARNING: " + (self.learning_key_name or "??")
+        # The learn countdown and temp info redraw the screen without changing this line
+        key = (self._learn_state, self.current_key_group_index, self.current_key_index)
+        if key == self._status_line_key:
+            return self._status_line
+        if self._learn_state:
+            line = "LEARNING: " + (self.learning_key_name or "??")
         else:
             group_name, current_key_list = self._get_current_key_data()
             if current_key_list:
                 current_idx = self.current_key_index + 1
                 total_keys = len(current_key_list)
-                return f"{group_name}: {current_idx}/{total_keys}"
+                line = f"{group_name}: {current_idx}/{total_keys}"
             else:
-                return f"{group_name}: No Keys"
+                line = f"{group_name}: No Keys"
+        self._status_line_key = key
+        self._status_line = line
+        return line
 
     def _ensure_mappings_directory(self):
+        if self._fs_writable:
+            return True
         try:
             if not self._remount_rw():
                 return False
             
-            if "mappings" not in os.listdir("/"):
+            if not _exists("/mappings"):
                 os.mkdir("/mappings")
             
             test_file = '/mappings/.test'
-            with open(test_file, 'w') as f:
-                f.write('test')
-            os.remove(test_file)
+            try:
+                with open(test_file, 'wb') as f:
+                    f.write(b't')
+            finally:
+                # Never leave the probe behind, even when the write fails halfway
+                try:
+                    os.remove(test_file)
+                except OSError:
+                    pass
+            self._fs_writable = True
             return True
         except:
             return False
 
-    def _set_temp_display(self, status=None, info=None, duration=None, update_now=True):
+    def _set_temp_display(self, status=None, info=None, duration=None, update_now=False):
         if duration is None:
-            duration = settings.get_value("hid_mapper", "timing", {}).get("temp_message_duration", 0.5)
+            duration = self._temp_message_duration
             
         expiry_time = time.monotonic() + duration
         
@@ -870,86 +1091,98 @@ class HIDMapperDevice:
         return True
 
     def exit_learn_mode(self):
-        self.in_learning_mode = False
-        self.learning_key_name = None
+        self._learn_state = 0
+        self._learn_exit_at = 0
         self.learning_remaining_time = 0
         self.visual_feedback(False)
         
         self.temp_display_status = None
         self.temp_display_info = None
         self.temp_display_expiry = 0.0
+        # Picked up by the end-of-tick flush in update()
         self._display_needs_update = True
-        self._update_display(force_update=True)
+        gc.collect()
 
     def process_learning_mode(self):
-        if not self.in_learning_mode:
+        if not self._learn_state:
+            return
+
+        now_ns = time.monotonic_ns()
+        if self._learn_exit_at:
+            if now_ns >= self._learn_exit_at:
+                self.exit_learn_mode()
             return
 
-        timing_prefs = settings.get_section("hid_mapper", {}).get("timing", {})
-        timeout = timing_prefs.get("ir_timeout", 20000) / 1000.0
-        elapsed = time.monotonic() - self.learning_start_time
+        remaining = self._learn_deadline - now_ns
 
-        if elapsed >= timeout:
+        if remaining <= 0:
             self._set_temp_display("Timeout", "No IR signal", 1.5)
             self.visual_feedback(True, 0.5, blink_count=2)
-            time.sleep(1)
-            self.exit_learn_mode()
+            self._finish_learning(1)
         else:
-            if self.display and int(elapsed) % 2 != int(elapsed-0.1) % 2:
-                remaining = int(timeout - elapsed)
+            remaining //= 1_000_000_000
+            if self.display and remaining != self.learning_remaining_time:
                 self.learning_remaining_time = remaining
                 self._update_display(info=f"Time: {remaining}s", force_update=True)
-            else:
-                self._display_needs_update = True
                  
-            self.visual_feedback(True)
+            if not self._led_schedule:
+                self.visual_feedback(True)
 
     def save_mapping(self, ir_code, key_name):
         try:
             if not self._ensure_mappings_directory():
                 self._set_temp_display("Error", "Directory inaccessible", 1.5)
                 self.visual_feedback(True, 0.1, blink_count=5)
-                time.sleep(1.5)
-                self.exit_learn_mode()
+                self._finish_learning(1.5)
                 return False
             
             safe_filename = key_name.lower().replace("/", "_")
             filepath = f"/mappings/{safe_filename}.ir"
-            ir_code_hex = f"0x{ir_code:08x}"
+            # 4 raw big-endian bytes; _load_mappings still reads the older hex text files
+            payload = ir_code.to_bytes(4, "big")
             
             write_success = False
             for attempt in range(3):
                 try:
-                    if attempt > 0:
+                    # Only an EROFS failure (which clears _fs_writable) warrants another remount
+                    if not self._fs_writable:
                         self._remount_rw()
                     
-                    if attempt == 0 and "mappings" not in os.listdir("/"):
+                    # Write then rename so a power cut never leaves a half-written mapping
+                    tmp_path = filepath + ".tmp"
+                    with open(tmp_path, "wb") as f:
+                        f.write(payload)
+                    os.rename(tmp_path, filepath)
+                    write_success = True
+                    break
+                except OSError as e:
+                    if e.errno == errno.EROFS:
+                        self._fs_writable = False
+                    elif e.errno == errno.ENOENT:
+                        # Directory vanished since _ensure_mappings_directory
                         try:
                             os.mkdir("/mappings")
-                        except:
                             continue
-                    
-                    with open(filepath, "w") as f:
-                        f.write(ir_code_hex)
-                    write_success = True
-                    break
-                except:
-                    time.sleep(0.3)
+                        except OSError:
+                            pass
+                    time.sleep(0.05 * (1 << attempt))
             
             if not write_success:
                 self._set_temp_display("Save Error", "Try again", 1.5)
                 self.visual_feedback(True, 0.1, blink_count=5)
-                time.sleep(1.5)
-                self.exit_learn_mode()
+                self._finish_learning(1.5)
                 return False
             
-            self.ir_mappings[ir_code] = key_name.lower()
+            self.ir_mappings[ir_code] = safe_filename
+            if self.ir_manager:
+                self.ir_manager.cache_mapping(ir_code, safe_filename)
+            # Rebuild rather than add: the code may have been mapped to another key
+            self._mapped_keys = set(self.ir_mappings.values())
+            self._mapping_count_text = f"Mappings: {len(self.ir_mappings)}"
 
-            self._display_needs_update = True
             self._set_temp_display("Saved", f"{key_name}", 1.0)
             
-            time.sleep(1)
-            self.exit_learn_mode()
+            self._finish_learning(1)
             return True
         except:
             self.visual_feedback(True, 0.1, blink_count=5)
@@ -962,53 +1195,44 @@ class HIDMapperDevice:
                 self.visual_feedback(True, 0.1, blink_count=3)
                 return False
             
-            if not hasattr(self, 'keyboard') or not self.keyboard:
+            entry = self._key_lookup.get(key_name.lower())
+            if entry is None:
                 return False
-                
-            key_name = key_name.lower()
-                
-            if key_name not in COMMAND_NAME_TO_KEYCODE:
-                alt_key_name = key_name.replace("_", "/")
-                if alt_key_name in COMMAND_NAME_TO_KEYCODE:
-                    key_name = alt_key_name
-                else:
-                    return False
-            
-            key_code = COMMAND_NAME_TO_KEYCODE[key_name]
             
-            if isinstance(key_code, tuple) and len(key_code) == 3 and key_code[2]:
-                if hasattr(self, 'consumer_control') and self.consumer_control:
-                    self.consumer_control.send(key_code[1])
+            press_args, is_media = entry
+            if is_media:
+                consumer_control = self._get_consumer_control()
+                if consumer_control:
+                    consumer_control.send(press_args)
                 else:
                     return False
             else:
-                if isinstance(key_code, tuple):
-                    self.keyboard.press(*key_code)
-                    self.keyboard.release_all()
-                else:
-                    self.keyboard.press(key_code)
-                    self.keyboard.release_all()
+                keyboard = self._get_keyboard()
+                if not keyboard:
+                    return False
+                keyboard.press(*press_args)
+                keyboard.release_all()
                     
             return True
         except:
             return False
 
     def _log_device_status(self):
-        logger.info("Status", f"Picomote IR v{__version__} initialized")
+        logger.info("Status", "Picomote IR v%s initialized", __version__)
         
         components = [
             ("Display", self.display is not None, "available" if self.display else "not available"),
             ("Encoder", self.encoder is not None, "available" if self.encoder else "not available"),
             ("IR Receiver", self.ir_manager is not None, "active" if self.ir_manager else "inactive"),
             ("LED", self.led is not None, "enabled" if self.led else "disabled"),
-            ("USB HID", self.keyboard is not None, "connected" if self.keyboard else "not connected")
+            ("USB HID", HAS_HID and self.usb_connected, "ready" if HAS_HID and self.usb_connected else "not connected")
         ]
         
         for name, status, status_text in components:
-            logger.info("Status", f"{name}: {status_text}")
+            logger.info("Status", "%s: %s", name, status_text)
         
         mapping_count = len(self.ir_mappings)
-        logger.info("Status", f"Loaded {mapping_count} IR mappings")
+        logger.info("Status", "Loaded %d IR mappings", mapping_count)
         
         mode = "Deep Idle" if self.in_deep_idle_mode else "Normal"
-        logger.info("Status", f"Starting in {mode} mode") 
\ No newline at end of file
+        logger.info("Status", "Starting in %s mode", mode) 
\ No newline at end of file
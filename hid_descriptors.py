@@ -0,0 +1,53 @@
+"""USB HID report descriptors for Picomote IR
+
+Defines the keyboard and consumer control descriptors registered by boot.py.
+"""
+
+KEYBOARD_REPORT_DESCRIPTOR = (
+    b'\x05\x01'  # Usage Page (Generic Desktop)
+    b'\x09\x06'  # Usage (Keyboard)
+    b'\xA1\x01'  # Collection (Application)
+    b'\x05\x07'  # Usage Page (Key Codes)
+    b'\x19\xE0'  # Usage Minimum (Left Control)
+    b'\x29\xE7'  # Usage Maximum (Right GUI)
+    b'\x15\x00'  # Logical Minimum (0)
+    b'\x25\x01'  # Logical Maximum (1)
+    b'\x75\x01'  # Report Size (1)
+    b'\x95\x08'  # Report Count (8)
+    b'\x81\x02'  # Input (Data, Variable, Absolute)
+    b'\x95\x01'  # Report Count (1)
+    b'\x75\x08'  # Report Size (8)
+    b'\x81\x01'  # Input (Constant)
+    b'\x95\x05'  # Report Count (5)
+    b'\x75\x01'  # Report Size (1)
+    b'\x05\x08'  # Usage Page (LEDs)
+    b'\x19\x01'  # Usage Minimum (Num Lock)
+    b'\x29\x05'  # Usage Maximum (Kana)
+    b'\x91\x02'  # Output (Data, Variable, Absolute)
+    b'\x95\x01'  # Report Count (1)
+    b'\x75\x03'  # Report Size (3)
+    b'\x91\x01'  # Output (Constant)
+    b'\x95\x06'  # Report Count (6)
+    b'\x75\x08'  # Report Size (8)
+    b'\x15\x00'  # Logical Minimum (0)
+    b'\x25\xFF'  # Logical Maximum(255)
+    b'\x05\x07'  # Usage Page (Key Codes)
+    b'\x19\x00'  # Usage Minimum (0)
+    b'\x29\xFF'  # Usage Maximum (255)
+    b'\x81\x00'  # Input (Data, Array)
+    b'\xC0'      # End Collection
+)
+
+CONSUMER_CONTROL_REPORT_DESCRIPTOR = (
+    b'\x05\x0C'      # Usage Page (Consumer)
+    b'\x09\x01'      # Usage (Consumer Control)
+    b'\xA1\x01'      # Collection (Application)
+    b'\x75\x10'      # Report Size (16) bits = 2 bytes
+    b'\x95\x01'      # Report Count (1)
+    b'\x15\x01'      # Logical Minimum (1)
+    b'\x26\xFF\x03'  # Logical Maximum (1023)
+    b'\x19\x01'      # Usage Minimum (1)
+    b'\x2A\xFF\x03'  # Usage Maximum (1023)
+    b'\x81\x00'      # Input (Data, Array)
+    b'\xC0'          # End Collection
+)
@@ -3,12 +3,114 @@
 Handles IR signal reception, decoding, and mapping with efficient caching.
 """
 
+import array
 import time
 from config import HAS_IRREMOTE
 
 if HAS_IRREMOTE:
     import adafruit_irremote
 
+# Fewer buffered pulses than this cannot form a decodable frame
+MIN_FRAME_PULSES = 8
+# A pulse longer than this (µs) is an inter-frame gap, as in GenericDecode.read_pulses
+MAX_PULSE_US = 10000
+
+# NEC: 9 ms mark + 4.5 ms space header, 32 mark/space bits, trailing mark
+NEC_FRAME_PULSES = 67
+
+def decode_nec(buf, count):
+    """
+    Fast path for standard NEC frames
+    
+    Produces the same 32-bit value as GenericDecode (bits in arrival order,
+    MSB first) so existing mappings keep matching.
+    
+    Args:
+        buf: Pulse lengths in microseconds
+        count: Number of valid pulses in buf
+        
+    Returns:
+        int or None: IR code, or None if this is not a clean NEC frame
+    """
+    if count != NEC_FRAME_PULSES:
+        return None
+    if not (8000 <= buf[0] <= 10000 and 3500 <= buf[1] <= 5500):
+        return None
+    code = 0
+    for i in range(3, NEC_FRAME_PULSES, 2):
+        space = buf[i]
+        if 1200 <= space <= 2200:
+            code = (code << 1) | 1
+        elif 300 <= space <= 900:
+            code <<= 1
+        else:
+            return None
+    return code
+
+class IRMappingTable:
+    """Compact IR code to key name table kept as a sorted code array plus parallel names"""
+    
+    def __init__(self, mappings=None):
+        """
+        Build the table from an optional {ir_code: key_name} dict
+        
+        Args:
+            mappings: Initial mappings (only used during construction)
+        """
+        self._build(mappings or {})
+    
+    def _build(self, mappings):
+        codes = sorted(mappings)
+        self.codes = array.array('I', codes)
+        self.names = [mappings[code] for code in codes]
+    
+    def _index(self, ir_code):
+        """Binary search for ir_code; returns its index or -1"""
+        codes = self.codes
+        lo = 0
+        hi = len(codes)
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if codes[mid] < ir_code:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(codes) and codes[lo] == ir_code:
+            return lo
+        return -1
+    
+    def get(self, ir_code, default=None):
+        idx = self._index(ir_code)
+        return self.names[idx] if idx >= 0 else default
+    
+    def __contains__(self, ir_code):
+        return self._index(ir_code) >= 0
+    
+    def __getitem__(self, ir_code):
+        idx = self._index(ir_code)
+        if idx < 0:
+            raise KeyError(ir_code)
+        return self.names[idx]
+    
+    def __setitem__(self, ir_code, key_name):
+        idx = self._index(ir_code)
+        if idx >= 0:
+            self.names[idx] = key_name
+            return
+        # New codes are rare (learning mode only), so rebuilding the arrays is acceptable
+        mappings = dict(self.items())
+        mappings[ir_code] = key_name
+        self._build(mappings)
+    
+    def __len__(self):
+        return len(self.codes)
+    
+    def values(self):
+        return self.names
+    
+    def items(self):
+        return zip(self.codes, self.names)
+
 class IRManager:
     """Manages IR signal processing with debouncing and mapping cache"""
     
@@ -23,59 +125,77 @@ class IRManager:
         """
         self.pulsein = pulsein
         self.decoder = decoder or (adafruit_irremote.GenericDecode() if HAS_IRREMOTE else None)
-        self.last_code_time = 0
+        self.last_code_time = 0  # time.monotonic_ns() of the last accepted code
         self.last_code = None
-        self.debounce_time = 0.1  # 100ms debounce for repeat signals
+        self.debounce_ns = 100_000_000  # 100ms debounce for repeat signals
+        self.pending_pulse_count = 0
+        # One burst is copied here instead of into a fresh list per frame
+        self._pulse_buf = array.array('H', bytes(2 * pulsein.maxlen))
         
+        # Two-generation LRU: hits in previous_cache are promoted, and a full
+        # mapping_cache becomes previous_cache, evicting what was not reused
         self.mapping_cache = {}
-        self.cache_usage_count = {}
-        self.cache_access_time = {}
+        self.previous_cache = {}
         self.max_cache_size = cache_size
         
         self.cache_hits = 0
         self.cache_misses = 0
-        self.total_lookups = 0
     
     def get_ir_code(self):
         """
         Process IR signals and return decoded code with built-in debouncing
         
+        Debounce timing uses integer time.monotonic_ns(), read only once a
+        burst has settled, so idle polls never touch the clock.
+        
         Returns:
             int or None: IR code if valid signal detected, None otherwise
         """
-        if not self.pulsein or not self.decoder or len(self.pulsein) == 0:
+        pulsein = self.pulsein
+        decoder = self.decoder
+        pending = len(pulsein)
+        if not pending:
+            self.pending_pulse_count = 0
+            return None
+            
+        # Wait until the buffer stops growing, then drop short bursts without decoding
+        if pending != self.pending_pulse_count:
+            self.pending_pulse_count = pending
+            return None
+        self.pending_pulse_count = 0
+        if pending < MIN_FRAME_PULSES:
+            self.clear_buffer()
             return None
             
-        current_time = time.monotonic()
+        now_ns = time.monotonic_ns()
         
         try:
-            pulses = self.decoder.read_pulses(self.pulsein, blocking=False)
-            if not pulses or len(pulses) < 8:
+            count = self._read_burst(pulsein)
+            if count < MIN_FRAME_PULSES:
                 return None
 
-            code_values = self.decoder.decode_bits(pulses)
-
-            if len(code_values) >= 4:
-                ir_code = 0
-                for byte_val in code_values[:4]:
-                    ir_code = (ir_code << 8) | byte_val
-
-                # Debouncing: ignore same code within debounce window
-                if (ir_code == self.last_code and 
-                    current_time - self.last_code_time < self.debounce_time):
+            ir_code = decode_nec(self._pulse_buf, count)
+            if ir_code is None:
+                # Other protocols (Sony, RC5/RC6, Samsung, ...) go through the generic decoder
+                code_values = decoder.decode_bits(memoryview(self._pulse_buf)[:count])
+                if len(code_values) < 4:
                     return None
-                
-                self.last_code = ir_code
-                self.last_code_time = current_time
-                
-                return ir_code
-            else:
+                ir_code = int.from_bytes(bytes(code_values[:4]), "big")
+
+            # Debouncing: ignore same code within debounce window
+            if (ir_code == self.last_code and 
+                now_ns - self.last_code_time < self.debounce_ns):
                 return None
+            
+            self.last_code = ir_code
+            self.last_code_time = now_ns
+            
+            return ir_code
 
         except adafruit_irremote.IRNECRepeatException:
             # Handle repeat signals - return last code if within reasonable time
             if (self.last_code and 
-                current_time - self.last_code_time < 0.5):  # 500ms repeat window
+                now_ns - self.last_code_time < 500_000_000):  # 500ms repeat window
                 return self.last_code
             return None
             
@@ -84,17 +204,37 @@ class IRManager:
             
         finally:
             # Always clear the buffer
-            if self.pulsein:
-                try:
-                    self.pulsein.clear()
-                except:
-                    pass
+            pulsein.clear()
                     
         return None
     
+    def _read_burst(self, pulsein):
+        """
+        Drain one burst from pulsein into the reusable pulse buffer
+        
+        The buffer has already stopped growing when this runs, so unlike
+        GenericDecode.read_pulses there is no need to sleep for a settle window.
+        
+        Returns:
+            int: Number of pulses stored in self._pulse_buf
+        """
+        buf = self._pulse_buf
+        capacity = len(buf)
+        count = 0
+        while pulsein:
+            pulse = pulsein.popleft()
+            if pulse > MAX_PULSE_US:
+                if count == 0:
+                    continue
+                break
+            if count < capacity:
+                buf[count] = pulse
+                count += 1
+        return count
+    
     def lookup_mapping(self, ir_code, full_mappings):
         """
-        Fast lookup of IR code mapping with intelligent caching
+        Fast lookup of IR code mapping with a two-generation cache
         
         Args:
             ir_code: IR code to lookup
@@ -103,51 +243,44 @@ class IRManager:
         Returns:
             str or None: Mapped key name if found, None otherwise
         """
-        self.total_lookups += 1
-        current_time = time.monotonic()
+        key_name = self.mapping_cache.get(ir_code)
+        if key_name is not None:
+            self.cache_hits += 1
+            return key_name
         
-        # Check cache first
-        if ir_code in self.mapping_cache:
+        key_name = self.previous_cache.pop(ir_code, None)
+        if key_name is not None:
             self.cache_hits += 1
-            self.cache_usage_count[ir_code] = self.cache_usage_count.get(ir_code, 0) + 1
-            self.cache_access_time[ir_code] = current_time
-            return self.mapping_cache[ir_code]
+            self._cache_insert(ir_code, key_name)
+            return key_name
         
         # Cache miss - lookup in full mappings
         self.cache_misses += 1
-        
-        if ir_code in full_mappings:
-            key_name = full_mappings[ir_code]
-            
-            # Add to cache if there's space
-            if len(self.mapping_cache) < self.max_cache_size:
-                self.mapping_cache[ir_code] = key_name
-                self.cache_usage_count[ir_code] = 1
-                self.cache_access_time[ir_code] = current_time
-            else:
-                # Cache is full - evict least recently used item
-                self._evict_lru_item()
-                self.mapping_cache[ir_code] = key_name
-                self.cache_usage_count[ir_code] = 1
-                self.cache_access_time[ir_code] = current_time
-            
-            return key_name
-        
-        return None
+        key_name = full_mappings.get(ir_code)
+        if key_name is not None:
+            self._cache_insert(ir_code, key_name)
+        return key_name
     
-    def _evict_lru_item(self):
-        """Evict the least recently used item from cache"""
-        if not self.cache_access_time:
-            return
-            
-        # Find item with oldest access time
-        oldest_code = min(self.cache_access_time.keys(), 
-                         key=lambda k: self.cache_access_time[k])
+    def _cache_insert(self, ir_code, key_name):
+        """Add to the current generation, rotating generations when it is full"""
+        if len(self.mapping_cache) >= self.max_cache_size:
+            self.previous_cache = self.mapping_cache
+            self.mapping_cache = {}
+        self.mapping_cache[ir_code] = key_name
+    
+    def cache_mapping(self, ir_code, key_name):
+        """
+        Record a newly learned mapping so a stale cached name cannot shadow it
         
-        # Remove from all cache structures
-        del self.mapping_cache[oldest_code]
-        del self.cache_usage_count[oldest_code]
-        del self.cache_access_time[oldest_code]
+        Args:
+            ir_code: IR code that was (re)mapped
+            key_name: Key name now stored for ir_code
+        """
+        self.previous_cache.pop(ir_code, None)
+        if ir_code in self.mapping_cache:
+            self.mapping_cache[ir_code] = key_name
+        else:
+            self._cache_insert(ir_code, key_name)
     
     def preload_frequent_mappings(self, mappings, max_preload=5):
         """
@@ -167,8 +300,6 @@ class IRManager:
                 break
                 
             self.mapping_cache[ir_code] = key_name
-            self.cache_usage_count[ir_code] = 0
-            self.cache_access_time[ir_code] = time.monotonic()
     
     def get_cache_stats(self):
         """
@@ -177,11 +308,13 @@ class IRManager:
         Returns:
             dict: Cache statistics
         """
-        hit_rate = (self.cache_hits / self.total_lookups * 100) if self.total_lookups > 0 else 0.0
+        # Derived here so lookups only ever bump one counter
+        total_lookups = self.cache_hits + self.cache_misses
+        hit_rate = (self.cache_hits / total_lookups * 100) if total_lookups > 0 else 0.0
         return {
-            'cache_size': len(self.mapping_cache),
+            'cache_size': len(self.mapping_cache) + len(self.previous_cache),
             'max_cache_size': self.max_cache_size,
-            'total_lookups': self.total_lookups,
+            'total_lookups': total_lookups,
             'cache_hits': self.cache_hits,
             'cache_misses': self.cache_misses,
             'hit_rate_percent': hit_rate
@@ -190,16 +323,17 @@ class IRManager:
     def clear_cache(self):
         """Clear the mapping cache"""
         self.mapping_cache.clear()
-        self.cache_usage_count.clear()
-        self.cache_access_time.clear()
+        self.previous_cache.clear()
+    
+    @property
+    def receiving(self):
+        """True while a burst is still arriving and get_ir_code is waiting for it to settle"""
+        return self.pending_pulse_count != 0
     
     def clear_buffer(self):
         """Clear the IR input buffer"""
-        if self.pulsein:
-            try:
-                self.pulsein.clear()
-            except:
-                pass
+        self.pending_pulse_count = 0
+        self.pulsein.clear()
     
     def reset_debounce(self):
         """Reset debounce state - useful when entering learning mode"""
@@ -0,0 +1,37 @@
+"""Keymap generator for Picomote IR
+
+Runs on the host (not on the device) and writes _keymap.py, a literal
+COMMAND_NAME_TO_KEYCODE table, so config.py does not have to build it at
+every boot. Re-run after changing the key name/code tables in config.py:
+
+    python tools/gen_keymap.py
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "lib")]
+
+import config
+
+def main():
+    if not (config.HAS_KEYCODE and config.HAS_CONSUMER):
+        sys.exit("adafruit_hid not found in lib/ - cannot generate keymap")
+
+    command_map = config.build_command_map()
+    lines = [
+        '"""Generated by tools/gen_keymap.py - do not edit"""',
+        "",
+        "COMMAND_NAME_TO_KEYCODE = {",
+    ]
+    for name, code in command_map.items():
+        lines.append(f"    {name!r}: {code!r},")
+    lines.append("}")
+
+    with open(os.path.join(ROOT, "_keymap.py"), "w") as f:
+        f.write("\n".join(lines) + "\n")
+    print(f"Wrote {len(command_map)} entries to _keymap.py")
+
+if __name__ == "__main__":
+    main()